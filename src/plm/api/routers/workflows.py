@@ -387,8 +387,8 @@ def _instance_to_response(instance: WorkflowInstance) -> WorkflowInstanceRespons
         initiated_by=instance.initiated_by,
         initiated_at=instance.initiated_at.isoformat() if instance.initiated_at else None,
         completed_at=instance.completed_at.isoformat() if instance.completed_at else None,
-        pending_tasks=len(instance.pending_tasks),
-        completed_tasks=len(instance.completed_tasks),
+        pending_tasks=instance.pending_count,
+        completed_tasks=instance.completed_count,
         tasks=[_task_to_response(t) for t in instance.tasks],
         transitions=[_transition_to_response(tr) for tr in instance.transitions],
     )
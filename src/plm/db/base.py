@@ -6,7 +6,7 @@ SQLAlchemy base, engine, and session setup.
 
 import os
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Generator
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
@@ -27,13 +27,24 @@ DATABASE_URL = os.getenv(
 # Create engine
 # For SQLite, need check_same_thread=False for FastAPI
 connect_args = {}
+engine_kwargs: dict[str, Any] = {}
 if DATABASE_URL.startswith("sqlite"):
     connect_args["check_same_thread"] = False
+else:
+    # Server databases: size the pool for concurrent API workers and
+    # drop connections the server or a proxy has silently closed.
+    engine_kwargs.update(
+        pool_size=int(os.getenv("PLM_DB_POOL_SIZE", "20")),
+        max_overflow=int(os.getenv("PLM_DB_MAX_OVERFLOW", "10")),
+        pool_recycle=int(os.getenv("PLM_DB_POOL_RECYCLE", "3600")),
+        pool_pre_ping=True,
+    )
 
 engine = create_engine(
     DATABASE_URL,
     connect_args=connect_args,
     echo=os.getenv("PLM_DB_ECHO", "false").lower() == "true",
+    **engine_kwargs,
 )
 
 # Session factory
@@ -17,6 +17,8 @@ from typing import Any, Optional
 from uuid import uuid4
 
 from .models import (
+    ACTIVE_STATUSES,
+    APPROVED_DECISIONS,
     ApprovalDecision,
     ApprovalMode,
     StageType,
@@ -163,8 +165,7 @@ class WorkflowEngine:
 
     def get_active_instances(self) -> list[WorkflowInstance]:
         """Get all active workflow instances."""
-        active_statuses = [WorkflowStatus.ACTIVE, WorkflowStatus.PENDING_APPROVAL]
-        return [i for i in self._instances.values() if i.status in active_statuses]
+        return [i for i in self._instances.values() if i.status in ACTIVE_STATUSES]
 
     def get_tasks_for_user(self, user_id: str) -> list[WorkflowTask]:
         """Get all pending tasks assigned to a user."""
@@ -344,7 +345,7 @@ class WorkflowEngine:
         if instance.initiated_by != user_id:
             raise ValueError("Only the initiator can recall a workflow")
 
-        if instance.status not in [WorkflowStatus.ACTIVE, WorkflowStatus.PENDING_APPROVAL]:
+        if instance.status not in ACTIVE_STATUSES:
             raise ValueError(f"Cannot recall workflow in status: {instance.status.value}")
 
         # Mark all pending tasks as recalled
@@ -462,10 +463,7 @@ class WorkflowEngine:
             return
 
         # Check completion based on approval mode
-        approvals = [
-            t for t in completed
-            if t.decision in [ApprovalDecision.APPROVED, ApprovalDecision.APPROVED_WITH_CONDITIONS]
-        ]
+        approvals = [t for t in completed if t.decision in APPROVED_DECISIONS]
 
         stage_complete = False
         if stage.approval_mode == ApprovalMode.ALL:
@@ -480,7 +478,9 @@ class WorkflowEngine:
 
         if stage_complete:
             # Advance to next stage
-            next_stage = definition.get_next_stage(stage.id)
+            next_stage = definition.get_next_stage_on_decision(
+                stage.id, ApprovalDecision.APPROVED
+            )
             if next_stage:
                 self._enter_stage(instance, definition, next_stage, triggered_by)
             else:
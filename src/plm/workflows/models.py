@@ -11,10 +11,13 @@ Workflow concepts:
 - Transition: Movement between stages
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Optional
+from functools import cached_property
+from itertools import islice
+from typing import Any, Iterable, Optional
 
 
 class WorkflowStatus(str, Enum):
@@ -58,6 +61,22 @@ class ApprovalMode(str, Enum):
     FIRST = "first"                 # First response wins
 
 
+# Decisions that leave a task open
+_NON_TERMINAL_DECISIONS = frozenset({ApprovalDecision.PENDING})
+
+# Decisions that count as an approval
+APPROVED_DECISIONS = frozenset({
+    ApprovalDecision.APPROVED,
+    ApprovalDecision.APPROVED_WITH_CONDITIONS,
+})
+
+# Statuses of a workflow that is still in progress
+ACTIVE_STATUSES = frozenset({WorkflowStatus.ACTIVE, WorkflowStatus.PENDING_APPROVAL})
+
+# Number of transitions included in WorkflowInstance.to_dict()
+RECENT_TRANSITIONS_LIMIT = 50
+
+
 @dataclass
 class WorkflowStage:
     """
@@ -97,11 +116,11 @@ class WorkflowStage:
         return {
             "id": self.id,
             "name": self.name,
-            "stage_type": self.stage_type.value,
+            "stage_type": self.stage_type,
             "sequence": self.sequence,
             "approver_roles": self.approver_roles,
             "approver_users": self.approver_users,
-            "approval_mode": self.approval_mode.value,
+            "approval_mode": self.approval_mode,
             "due_days": self.due_days,
             "required": self.required,
             "instructions": self.instructions,
@@ -123,7 +142,7 @@ class WorkflowDefinition:
     # What this workflow applies to
     entity_types: list[str] = field(default_factory=list)  # ["eco", "document", "part"]
 
-    # Stages
+    # Stages (use add_stage() after construction to keep lookups current)
     stages: list[WorkflowStage] = field(default_factory=list)
 
     # Workflow settings
@@ -141,33 +160,92 @@ class WorkflowDefinition:
     created_at: Optional[datetime] = None
     created_by: Optional[str] = None
 
+    # Stage routing, compiled once from `stages` (see _compute_order)
+    _order: list[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _succ: dict[str, dict[str, Optional[str]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.now()
+        self._compute_order()
+
+    def _compute_order(self) -> None:
+        """
+        Compile the stage graph so routing lookups don't re-sort.
+
+        `_order` holds stage IDs sorted by sequence. `_succ` maps each
+        stage ID to its successors: "next" is the linear successor,
+        "approve" honours next_stage_on_approve (falling back to the
+        linear successor) and "reject" is next_stage_on_reject.
+        """
+        ordered = sorted(self.stages, key=lambda s: s.sequence)
+        self._order = [s.id for s in ordered]
+        self._succ = {}
+
+        for i, stage in enumerate(ordered):
+            linear_next = next(
+                (s.id for s in ordered[i + 1:] if s.sequence > stage.sequence),
+                None,
+            )
+            self._succ[stage.id] = {
+                "next": linear_next,
+                "approve": stage.next_stage_on_approve or linear_next,
+                "reject": stage.next_stage_on_reject,
+            }
+
+    @cached_property
+    def _stage_index(self) -> dict[str, WorkflowStage]:
+        """Stage lookup by ID, built on first use."""
+        return {s.id: s for s in self.stages}
+
+    def add_stage(self, stage: WorkflowStage) -> None:
+        """Add a stage and recompile routing."""
+        self.stages.append(stage)
+        self.__dict__.pop("_stage_index", None)
+        self._compute_order()
 
     def get_stage(self, stage_id: str) -> Optional[WorkflowStage]:
         """Get a stage by ID."""
-        for stage in self.stages:
-            if stage.id == stage_id:
-                return stage
-        return None
+        return self._stage_index.get(stage_id)
 
     def get_first_stage(self) -> Optional[WorkflowStage]:
         """Get the first stage in sequence."""
-        if not self.stages:
+        if not self._order:
             return None
-        return min(self.stages, key=lambda s: s.sequence)
+        return self.get_stage(self._order[0])
 
     def get_next_stage(self, current_stage_id: str) -> Optional[WorkflowStage]:
         """Get the next stage after the current one."""
-        current = self.get_stage(current_stage_id)
-        if not current:
+        edges = self._succ.get(current_stage_id)
+        if not edges or not edges["next"]:
             return None
-
-        next_stages = [s for s in self.stages if s.sequence > current.sequence]
-        if not next_stages:
+        return self.get_stage(edges["next"])
+
+    def get_next_stage_on_decision(
+        self,
+        current_stage_id: str,
+        decision: ApprovalDecision,
+    ) -> Optional[WorkflowStage]:
+        """
+        Get the stage to route to after a decision on the current stage.
+
+        Approvals follow next_stage_on_approve (or the linear successor),
+        rejections follow next_stage_on_reject. Other decisions don't route.
+        """
+        edges = self._succ.get(current_stage_id)
+        if not edges:
             return None
-        return min(next_stages, key=lambda s: s.sequence)
+
+        if decision in APPROVED_DECISIONS:
+            target = edges["approve"]
+        elif decision == ApprovalDecision.REJECTED:
+            target = edges["reject"]
+        else:
+            target = None
+
+        return self.get_stage(target) if target else None
 
     def to_dict(self) -> dict:
         return {
@@ -223,7 +301,7 @@ class WorkflowTask:
 
     @property
     def is_complete(self) -> bool:
-        return self.decision not in [ApprovalDecision.PENDING]
+        return self.decision not in _NON_TERMINAL_DECISIONS
 
     @property
     def is_overdue(self) -> bool:
@@ -240,7 +318,7 @@ class WorkflowTask:
             "assignee_id": self.assignee_id,
             "assignee_name": self.assignee_name,
             "assignee_type": self.assignee_type,
-            "decision": self.decision.value,
+            "decision": self.decision,
             "decision_date": self.decision_date.isoformat() if self.decision_date else None,
             "comments": self.comments,
             "conditions": self.conditions,
@@ -286,11 +364,11 @@ class WorkflowTransition:
             "timestamp": self.timestamp.isoformat(),
             "from_stage": self.from_stage_name,
             "to_stage": self.to_stage_name,
-            "from_status": self.from_status.value if self.from_status else None,
-            "to_status": self.to_status.value if self.to_status else None,
+            "from_status": self.from_status,
+            "to_status": self.to_status,
             "triggered_by": self.triggered_by,
             "trigger_type": self.trigger_type,
-            "decision": self.decision.value if self.decision else None,
+            "decision": self.decision,
             "comments": self.comments,
         }
 
@@ -317,11 +395,11 @@ class WorkflowInstance:
     current_stage_id: Optional[str] = None
     current_stage_name: Optional[str] = None
 
-    # Tasks
+    # Tasks (use add_task() to keep lookups current)
     tasks: list[WorkflowTask] = field(default_factory=list)
 
-    # History
-    transitions: list[WorkflowTransition] = field(default_factory=list)
+    # History (append-only audit trail)
+    transitions: deque[WorkflowTransition] = field(default_factory=deque)
 
     # Metadata
     initiated_by: Optional[str] = None
@@ -339,6 +417,16 @@ class WorkflowInstance:
         if self.initiated_at is None:
             self.initiated_at = datetime.now()
 
+    @property
+    def pending_count(self) -> int:
+        """Number of pending tasks, counted without building the list."""
+        return sum(1 for t in self.tasks if not t.is_complete)
+
+    @property
+    def completed_count(self) -> int:
+        """Number of completed tasks, counted without building the list."""
+        return sum(1 for t in self.tasks if t.is_complete)
+
     @property
     def pending_tasks(self) -> list[WorkflowTask]:
         """Get all pending tasks."""
@@ -356,10 +444,16 @@ class WorkflowInstance:
             return []
         return [t for t in self.tasks if t.stage_id == self.current_stage_id]
 
+    @cached_property
+    def _task_index(self) -> dict[str, WorkflowTask]:
+        """Task lookup by ID, built on first use."""
+        return {t.id: t for t in self.tasks}
+
     def add_task(self, task: WorkflowTask) -> None:
         """Add a task to this instance."""
         task.instance_id = self.id
         self.tasks.append(task)
+        self.__dict__.pop("_task_index", None)
 
     def add_transition(self, transition: WorkflowTransition) -> None:
         """Add a transition to history."""
@@ -368,12 +462,47 @@ class WorkflowInstance:
 
     def get_task(self, task_id: str) -> Optional[WorkflowTask]:
         """Get a task by ID."""
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._task_index.get(task_id)
+
+    def recent_transitions(self, n: int) -> list[WorkflowTransition]:
+        """Get the latest n transitions, oldest first."""
+        if n <= 0:
+            return []
+        recent = list(islice(reversed(self.transitions), n))
+        recent.reverse()
+        return recent
+
+    def export_transitions(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Serialize a page of the transition history (for audit export).
+
+        Args:
+            offset: Number of oldest transitions to skip
+            limit: Maximum transitions to return (None for all remaining)
+        """
+        stop = offset + limit if limit is not None else None
+        return [tr.to_dict() for tr in islice(self.transitions, offset, stop)]
+
+    def to_dict(
+        self,
+        transitions_limit: Optional[int] = RECENT_TRANSITIONS_LIMIT,
+    ) -> dict[str, Any]:
+        """
+        Serialize the instance.
+
+        Only the latest `transitions_limit` transitions are converted;
+        pass None to include the full history.
+        """
+        if transitions_limit is None:
+            transitions: Iterable[WorkflowTransition] = self.transitions
+        else:
+            transitions = self.recent_transitions(transitions_limit)
+        pending_count = self.pending_count
 
-    def to_dict(self) -> dict:
         return {
             "id": self.id,
             "definition_id": self.definition_id,
@@ -381,16 +510,16 @@ class WorkflowInstance:
             "entity_type": self.entity_type,
             "entity_id": self.entity_id,
             "entity_number": self.entity_number,
-            "status": self.status.value,
+            "status": self.status,
             "current_stage_id": self.current_stage_id,
             "current_stage_name": self.current_stage_name,
             "initiated_by": self.initiated_by,
             "initiated_at": self.initiated_at.isoformat() if self.initiated_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "pending_tasks": len(self.pending_tasks),
-            "completed_tasks": len(self.completed_tasks),
+            "pending_tasks": pending_count,
+            "completed_tasks": len(self.tasks) - pending_count,
             "tasks": [t.to_dict() for t in self.tasks],
-            "transitions": [tr.to_dict() for tr in self.transitions],
+            "transitions": [tr.to_dict() for tr in transitions],
         }
 
 
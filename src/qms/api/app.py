@@ -12,6 +12,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from .auth import require_api_key
 from .routers import quality, warranty
 
+# All /api/v1/* routes require an API key
+_API_KEY_DEPS = (Depends(require_api_key),)
+
 
 def create_app() -> FastAPI:
     """Create and configure the QMS FastAPI application."""
@@ -37,13 +40,14 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Include routers — all /api/v1/* routes require API key
-    api_deps = [Depends(require_api_key)]
+    # Include routers
     app.include_router(
-        quality.router, prefix="/api/v1/quality", tags=["Quality"], dependencies=api_deps
+        quality.router, prefix="/api/v1/quality", tags=["Quality"],
+        dependencies=list(_API_KEY_DEPS),
     )
     app.include_router(
-        warranty.router, prefix="/api/v1/warranty", tags=["Warranty"], dependencies=api_deps
+        warranty.router, prefix="/api/v1/warranty", tags=["Warranty"],
+        dependencies=list(_API_KEY_DEPS),
     )
 
     @app.get("/health")
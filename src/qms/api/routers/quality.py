@@ -6,12 +6,19 @@ Endpoints for NCRs, CAPAs, inspections, and quality holds.
 
 from datetime import date
 from decimal import Decimal
-from typing import Optional
+from typing import Annotated, Any, Optional, TypeVar
 
-from fastapi import APIRouter, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
 from qms.quality import (
+    CAPA,
+    InspectionRecord,
+    NonConformanceReport,
+    QualityHold,
+    QualityService,
     get_quality_service,
     NCRStatus,
     NCRSeverity,
@@ -23,6 +30,66 @@ from qms.quality import (
 
 router = APIRouter()
 
+T = TypeVar("T")
+
+QualityServiceDep = Annotated[QualityService, Depends(get_quality_service)]
+
+
+def _json_response(payload: Any) -> Response:
+    """Encode a to_dict() payload with orjson, skipping jsonable_encoder."""
+    return Response(content=orjson.dumps(payload), media_type="application/json")
+
+
+def _require(record: Optional[T]) -> T:
+    """Narrow a service mutator's result; the route's *Dep has already 404'd a missing record."""
+    assert record is not None
+    return record
+
+
+# =============================================================================
+# Dependencies
+# =============================================================================
+
+async def get_ncr_or_404(ncr_id: str, service: QualityServiceDep) -> NonConformanceReport:
+    """Resolve the NCR from the path or raise 404."""
+    ncr = service.get_ncr(ncr_id)
+    if not ncr:
+        raise HTTPException(status_code=404, detail="NCR not found")
+    return ncr
+
+
+async def get_capa_or_404(capa_id: str, service: QualityServiceDep) -> CAPA:
+    """Resolve the CAPA from the path or raise 404."""
+    capa = service.get_capa(capa_id)
+    if not capa:
+        raise HTTPException(status_code=404, detail="CAPA not found")
+    return capa
+
+
+async def get_inspection_or_404(
+    inspection_id: str,
+    service: QualityServiceDep,
+) -> InspectionRecord:
+    """Resolve the inspection from the path or raise 404."""
+    inspection = service.get_inspection(inspection_id)
+    if not inspection:
+        raise HTTPException(status_code=404, detail="Inspection not found")
+    return inspection
+
+
+async def get_hold_or_404(hold_id: str, service: QualityServiceDep) -> QualityHold:
+    """Resolve the hold from the path or raise 404."""
+    hold = service.get_hold(hold_id)
+    if not hold:
+        raise HTTPException(status_code=404, detail="Hold not found")
+    return hold
+
+
+NCRDep = Annotated[NonConformanceReport, Depends(get_ncr_or_404)]
+CAPADep = Annotated[CAPA, Depends(get_capa_or_404)]
+InspectionDep = Annotated[InspectionRecord, Depends(get_inspection_or_404)]
+HoldDep = Annotated[QualityHold, Depends(get_hold_or_404)]
+
 
 # =============================================================================
 # Request/Response Models
@@ -86,6 +153,24 @@ class CAPAAction(BaseModel):
     due_date: Optional[date] = None
 
 
+class CAPAVerification(BaseModel):
+    """CAPA verification request."""
+    verified_by: str
+    verification_method: str = ""
+    verification_results: str
+
+
+class CAPAEffectivenessReview(BaseModel):
+    """CAPA effectiveness review request."""
+    effective: bool
+    result: str
+
+
+class CAPAClose(BaseModel):
+    """Close CAPA request."""
+    closed_by: str
+
+
 class InspectionCreate(BaseModel):
     """Create inspection record."""
     inspection_type: str = "receiving"
@@ -130,10 +215,9 @@ class HoldRelease(BaseModel):
 # NCR Endpoints
 # =============================================================================
 
-@router.post("/ncrs", tags=["NCRs"])
-async def create_ncr(data: NCRCreate):
+@router.post("/ncrs", tags=["NCRs"], response_model=None)
+async def create_ncr(data: NCRCreate, service: QualityServiceDep):
     """Create a new Non-Conformance Report."""
-    service = get_quality_service()
     ncr = service.create_ncr(
         title=data.title,
         description=data.description,
@@ -148,11 +232,12 @@ async def create_ncr(data: NCRCreate):
         detected_by=data.detected_by,
         project_id=data.project_id,
     )
-    return ncr.to_dict()
+    return _json_response(ncr.to_dict())
 
 
-@router.get("/ncrs", tags=["NCRs"])
+@router.get("/ncrs", tags=["NCRs"], response_model=None)
 async def list_ncrs(
+    service: QualityServiceDep,
     status: Optional[NCRStatus] = None,
     severity: Optional[NCRSeverity] = None,
     source: Optional[NCRSource] = None,
@@ -160,99 +245,91 @@ async def list_ncrs(
     project_id: Optional[str] = None,
 ):
     """List NCRs with optional filters."""
-    service = get_quality_service()
-    ncrs = service.list_ncrs(
+    ncrs, prefetched = service.list_ncrs_with_relations(
         status=status,
         severity=severity,
         source=source,
         part_number=part_number,
         project_id=project_id,
     )
-    return [n.to_dict() for n in ncrs]
+    return _json_response([n.to_dict(prefetched=prefetched[n.id]) for n in ncrs])
 
 
-@router.get("/ncrs/{ncr_id}", tags=["NCRs"])
-async def get_ncr(ncr_id: str):
+@router.get("/ncrs/{ncr_id}", tags=["NCRs"], response_model=None)
+async def get_ncr(ncr: NCRDep, service: QualityServiceDep):
     """Get NCR by ID."""
-    service = get_quality_service()
-    ncr = service.get_ncr(ncr_id)
-    if not ncr:
-        raise HTTPException(status_code=404, detail="NCR not found")
-    return ncr.to_dict()
+    return Response(content=service.to_json(ncr), media_type="application/json")
 
 
-@router.post("/ncrs/{ncr_id}/open", tags=["NCRs"])
-async def open_ncr(ncr_id: str):
+@router.post("/ncrs/{ncr_id}/open", tags=["NCRs"], response_model=None)
+async def open_ncr(ncr: NCRDep, service: QualityServiceDep):
     """Open an NCR for investigation."""
-    service = get_quality_service()
-    ncr = service.open_ncr(ncr_id)
-    if not ncr:
-        raise HTTPException(status_code=404, detail="NCR not found")
-    return ncr.to_dict()
+    updated = service.open_ncr(ncr.id)
+    return _json_response(_require(updated).to_dict())
 
 
-@router.post("/ncrs/{ncr_id}/investigate", tags=["NCRs"])
-async def update_investigation(ncr_id: str, data: NCRInvestigation):
+@router.post("/ncrs/{ncr_id}/investigate", tags=["NCRs"], response_model=None)
+async def update_investigation(
+    ncr: NCRDep,
+    data: NCRInvestigation,
+    service: QualityServiceDep,
+):
     """Update NCR investigation details."""
-    service = get_quality_service()
-    ncr = service.update_investigation(
-        ncr_id=ncr_id,
+    updated = service.update_investigation(
+        ncr_id=ncr.id,
         root_cause=data.root_cause,
         immediate_action=data.immediate_action,
         containment_action=data.containment_action,
     )
-    if not ncr:
-        raise HTTPException(status_code=404, detail="NCR not found")
-    return ncr.to_dict()
+    return _json_response(_require(updated).to_dict())
 
 
-@router.post("/ncrs/{ncr_id}/disposition", tags=["NCRs"])
-async def disposition_ncr(ncr_id: str, data: NCRDisposition):
+@router.post("/ncrs/{ncr_id}/disposition", tags=["NCRs"], response_model=None)
+async def disposition_ncr(
+    ncr: NCRDep,
+    data: NCRDisposition,
+    service: QualityServiceDep,
+):
     """Set disposition for NCR."""
-    service = get_quality_service()
-    ncr = service.disposition_ncr(
-        ncr_id=ncr_id,
+    updated = service.disposition_ncr(
+        ncr_id=ncr.id,
         disposition=data.disposition,
         disposition_notes=data.disposition_notes,
         disposition_by=data.disposition_by,
     )
-    if not ncr:
-        raise HTTPException(status_code=404, detail="NCR not found")
-    return ncr.to_dict()
+    return _json_response(_require(updated).to_dict())
 
 
-@router.post("/ncrs/{ncr_id}/close", tags=["NCRs"])
-async def close_ncr(ncr_id: str, closed_by: str = Query(...)):
+@router.post("/ncrs/{ncr_id}/close", tags=["NCRs"], response_model=None)
+async def close_ncr(
+    ncr: NCRDep,
+    service: QualityServiceDep,
+    closed_by: str = Query(...),
+):
     """Close an NCR."""
-    service = get_quality_service()
-    ncr = service.close_ncr(ncr_id, closed_by)
-    if not ncr:
-        raise HTTPException(status_code=404, detail="NCR not found")
-    return ncr.to_dict()
+    updated = service.close_ncr(ncr.id, closed_by)
+    return _json_response(_require(updated).to_dict())
 
 
-@router.post("/ncrs/{ncr_id}/create-capa", tags=["NCRs"])
+@router.post("/ncrs/{ncr_id}/create-capa", tags=["NCRs"], response_model=None)
 async def create_capa_from_ncr(
-    ncr_id: str,
+    ncr: NCRDep,
+    service: QualityServiceDep,
     capa_type: CAPAType = Query(...),
     owner_id: Optional[str] = None,
 ):
     """Create a CAPA from an NCR."""
-    service = get_quality_service()
-    capa = service.create_capa_from_ncr(ncr_id, capa_type, owner_id)
-    if not capa:
-        raise HTTPException(status_code=404, detail="NCR not found")
-    return capa.to_dict()
+    capa = service.create_capa_from_ncr(ncr.id, capa_type, owner_id)
+    return _json_response(_require(capa).to_dict())
 
 
 # =============================================================================
 # CAPA Endpoints
 # =============================================================================
 
-@router.post("/capas", tags=["CAPAs"])
-async def create_capa(data: CAPACreate):
+@router.post("/capas", tags=["CAPAs"], response_model=None)
+async def create_capa(data: CAPACreate, service: QualityServiceDep):
     """Create a new CAPA."""
-    service = get_quality_service()
     capa = service.create_capa(
         title=data.title,
         description=data.description,
@@ -263,115 +340,100 @@ async def create_capa(data: CAPACreate):
         owner_id=data.owner_id,
         due_date=data.due_date,
     )
-    return capa.to_dict()
+    return _json_response(capa.to_dict())
 
 
-@router.get("/capas", tags=["CAPAs"])
+@router.get("/capas", tags=["CAPAs"], response_model=None)
 async def list_capas(
+    service: QualityServiceDep,
     status: Optional[CAPAStatus] = None,
     capa_type: Optional[CAPAType] = None,
     priority: Optional[str] = None,
     owner_id: Optional[str] = None,
 ):
     """List CAPAs with optional filters."""
-    service = get_quality_service()
-    capas = service.list_capas(
+    capas, prefetched = service.list_capas_with_relations(
         status=status,
         capa_type=capa_type,
         priority=priority,
         owner_id=owner_id,
     )
-    return [c.to_dict() for c in capas]
+    return _json_response([c.to_dict(prefetched=prefetched[c.id]) for c in capas])
 
 
-@router.get("/capas/{capa_id}", tags=["CAPAs"])
-async def get_capa(capa_id: str):
+@router.get("/capas/{capa_id}", tags=["CAPAs"], response_model=None)
+async def get_capa(capa: CAPADep, service: QualityServiceDep):
     """Get CAPA by ID."""
-    service = get_quality_service()
-    capa = service.get_capa(capa_id)
-    if not capa:
-        raise HTTPException(status_code=404, detail="CAPA not found")
-    return capa.to_dict()
+    return Response(content=service.to_json(capa), media_type="application/json")
 
 
-@router.post("/capas/{capa_id}/root-cause", tags=["CAPAs"])
-async def update_root_cause(capa_id: str, data: CAPARootCause):
+@router.post("/capas/{capa_id}/root-cause", tags=["CAPAs"], response_model=None)
+async def update_root_cause(
+    capa: CAPADep,
+    data: CAPARootCause,
+    service: QualityServiceDep,
+):
     """Update CAPA root cause analysis."""
-    service = get_quality_service()
-    capa = service.update_root_cause(
-        capa_id=capa_id,
+    updated = service.update_root_cause(
+        capa_id=capa.id,
         root_cause_method=data.root_cause_method,
         root_cause_analysis=data.root_cause_analysis,
         root_causes=data.root_causes,
         contributing_factors=data.contributing_factors,
     )
-    if not capa:
-        raise HTTPException(status_code=404, detail="CAPA not found")
-    return capa.to_dict()
+    return _json_response(_require(updated).to_dict())
 
 
-@router.post("/capas/{capa_id}/actions", tags=["CAPAs"])
-async def add_capa_action(capa_id: str, data: CAPAAction):
+@router.post("/capas/{capa_id}/actions", tags=["CAPAs"], response_model=None)
+async def add_capa_action(capa: CAPADep, data: CAPAAction, service: QualityServiceDep):
     """Add action to CAPA."""
-    service = get_quality_service()
-    capa = service.add_action(
-        capa_id=capa_id,
+    updated = service.add_action(
+        capa_id=capa.id,
         action_type=data.action_type,
         description=data.description,
         assigned_to=data.assigned_to,
         due_date=data.due_date,
     )
-    if not capa:
-        raise HTTPException(status_code=404, detail="CAPA not found")
-    return capa.to_dict()
+    return _json_response(_require(updated).to_dict())
 
 
-@router.post("/capas/{capa_id}/verify", tags=["CAPAs"])
-async def verify_capa(
-    capa_id: str,
-    verified_by: str = Query(...),
-    verification_results: str = Query(...),
-):
+@router.post("/capas/{capa_id}/verify", tags=["CAPAs"], response_model=None)
+async def verify_capa(capa: CAPADep, data: CAPAVerification, service: QualityServiceDep):
     """Verify CAPA implementation."""
-    service = get_quality_service()
-    capa = service.verify_capa(capa_id, verified_by, verification_results)
-    if not capa:
-        raise HTTPException(status_code=404, detail="CAPA not found")
-    return capa.to_dict()
+    updated = service.verify_capa(
+        capa_id=capa.id,
+        verified_by=data.verified_by,
+        method=data.verification_method,
+        results=data.verification_results,
+    )
+    return _json_response(_require(updated).to_dict())
 
 
-@router.post("/capas/{capa_id}/effectiveness", tags=["CAPAs"])
+@router.post("/capas/{capa_id}/effectiveness", tags=["CAPAs"], response_model=None)
 async def review_effectiveness(
-    capa_id: str,
-    effective: bool = Query(...),
-    result: str = Query(...),
+    capa: CAPADep,
+    data: CAPAEffectivenessReview,
+    service: QualityServiceDep,
 ):
     """Record effectiveness review."""
-    service = get_quality_service()
-    capa = service.review_effectiveness(capa_id, effective, result)
-    if not capa:
-        raise HTTPException(status_code=404, detail="CAPA not found")
-    return capa.to_dict()
+    updated = service.review_effectiveness(capa.id, data.effective, data.result)
+    return _json_response(_require(updated).to_dict())
 
 
-@router.post("/capas/{capa_id}/close", tags=["CAPAs"])
-async def close_capa(capa_id: str, closed_by: str = Query(...)):
+@router.post("/capas/{capa_id}/close", tags=["CAPAs"], response_model=None)
+async def close_capa(capa: CAPADep, data: CAPAClose, service: QualityServiceDep):
     """Close a CAPA."""
-    service = get_quality_service()
-    capa = service.close_capa(capa_id, closed_by)
-    if not capa:
-        raise HTTPException(status_code=404, detail="CAPA not found")
-    return capa.to_dict()
+    updated = service.close_capa(capa.id, data.closed_by)
+    return _json_response(_require(updated).to_dict())
 
 
 # =============================================================================
 # Inspection Endpoints
 # =============================================================================
 
-@router.post("/inspections", tags=["Inspections"])
-async def create_inspection(data: InspectionCreate):
+@router.post("/inspections", tags=["Inspections"], response_model=None)
+async def create_inspection(data: InspectionCreate, service: QualityServiceDep):
     """Create a new inspection record."""
-    service = get_quality_service()
     inspection = service.create_inspection(
         inspection_type=data.inspection_type,
         part_id=data.part_id,
@@ -381,43 +443,42 @@ async def create_inspection(data: InspectionCreate):
         quantity_inspected=data.quantity_inspected,
         sample_size=data.sample_size,
     )
-    return inspection.to_dict()
+    return _json_response(inspection.to_dict())
 
 
-@router.get("/inspections", tags=["Inspections"])
+@router.get("/inspections", tags=["Inspections"], response_model=None)
 async def list_inspections(
+    service: QualityServiceDep,
     inspection_type: Optional[str] = None,
     result: Optional[str] = None,
     part_number: Optional[str] = None,
     lot_number: Optional[str] = None,
 ):
     """List inspections with optional filters."""
-    service = get_quality_service()
     inspections = service.list_inspections(
         inspection_type=inspection_type,
         result=result,
         part_number=part_number,
         lot_number=lot_number,
     )
-    return [i.to_dict() for i in inspections]
+    return _json_response([i.to_dict() for i in inspections])
 
 
-@router.get("/inspections/{inspection_id}", tags=["Inspections"])
-async def get_inspection(inspection_id: str):
+@router.get("/inspections/{inspection_id}", tags=["Inspections"], response_model=None)
+async def get_inspection(inspection: InspectionDep, service: QualityServiceDep):
     """Get inspection by ID."""
-    service = get_quality_service()
-    inspection = service.get_inspection(inspection_id)
-    if not inspection:
-        raise HTTPException(status_code=404, detail="Inspection not found")
-    return inspection.to_dict()
+    return Response(content=service.to_json(inspection), media_type="application/json")
 
 
-@router.post("/inspections/{inspection_id}/complete", tags=["Inspections"])
-async def complete_inspection(inspection_id: str, data: InspectionResult):
+@router.post("/inspections/{inspection_id}/complete", tags=["Inspections"], response_model=None)
+async def complete_inspection(
+    inspection: InspectionDep,
+    data: InspectionResult,
+    service: QualityServiceDep,
+):
     """Complete an inspection with results."""
-    service = get_quality_service()
-    inspection = service.complete_inspection(
-        inspection_id=inspection_id,
+    updated = service.complete_inspection(
+        inspection_id=inspection.id,
         result=data.result,
         quantity_accepted=data.quantity_accepted,
         quantity_rejected=data.quantity_rejected,
@@ -426,19 +487,20 @@ async def complete_inspection(inspection_id: str, data: InspectionResult):
         defects_found=data.defects_found,
         measurements=data.measurements,
     )
-    if not inspection:
-        raise HTTPException(status_code=404, detail="Inspection not found")
-    return inspection.to_dict()
+    return _json_response(_require(updated).to_dict())
 
 
 # =============================================================================
 # Quality Hold Endpoints
 # =============================================================================
 
-@router.post("/holds", tags=["Holds"])
-async def create_hold(data: HoldCreate, placed_by: str = Query(...)):
+@router.post("/holds", tags=["Holds"], response_model=None)
+async def create_hold(
+    data: HoldCreate,
+    service: QualityServiceDep,
+    placed_by: str = Query(...),
+):
     """Create a quality hold."""
-    service = get_quality_service()
     hold = service.create_hold(
         part_id=data.part_id,
         part_number=data.part_number,
@@ -450,57 +512,49 @@ async def create_hold(data: HoldCreate, placed_by: str = Query(...)):
         location_id=data.location_id,
         placed_by=placed_by,
     )
-    return hold.to_dict()
+    return _json_response(hold.to_dict())
 
 
-@router.get("/holds", tags=["Holds"])
+@router.get("/holds", tags=["Holds"], response_model=None)
 async def list_holds(
+    service: QualityServiceDep,
     active_only: bool = True,
     part_number: Optional[str] = None,
     lot_number: Optional[str] = None,
     hold_type: Optional[str] = None,
 ):
     """List quality holds."""
-    service = get_quality_service()
     holds = service.list_holds(
         active_only=active_only,
         part_number=part_number,
         lot_number=lot_number,
         hold_type=hold_type,
     )
-    return [h.to_dict() for h in holds]
+    return _json_response([h.to_dict() for h in holds])
 
 
-@router.get("/holds/{hold_id}", tags=["Holds"])
-async def get_hold(hold_id: str):
+@router.get("/holds/{hold_id}", tags=["Holds"], response_model=None)
+async def get_hold(hold: HoldDep, service: QualityServiceDep):
     """Get hold by ID."""
-    service = get_quality_service()
-    hold = service.get_hold(hold_id)
-    if not hold:
-        raise HTTPException(status_code=404, detail="Hold not found")
-    return hold.to_dict()
+    return Response(content=service.to_json(hold), media_type="application/json")
 
 
-@router.post("/holds/{hold_id}/release", tags=["Holds"])
-async def release_hold(hold_id: str, data: HoldRelease):
+@router.post("/holds/{hold_id}/release", tags=["Holds"], response_model=None)
+async def release_hold(hold: HoldDep, data: HoldRelease, service: QualityServiceDep):
     """Release a quality hold."""
-    service = get_quality_service()
-    hold = service.release_hold(
-        hold_id=hold_id,
+    updated = service.release_hold(
+        hold_id=hold.id,
         released_by=data.released_by,
         release_notes=data.release_notes,
     )
-    if not hold:
-        raise HTTPException(status_code=404, detail="Hold not found")
-    return hold.to_dict()
+    return _json_response(_require(updated).to_dict())
 
 
 # =============================================================================
 # Statistics
 # =============================================================================
 
-@router.get("/statistics", tags=["Statistics"])
-async def get_quality_statistics():
+@router.get("/statistics", tags=["Statistics"], response_model=None)
+async def get_quality_statistics(service: QualityServiceDep):
     """Get quality management statistics."""
-    service = get_quality_service()
-    return service.get_statistics()
+    return _json_response(service.get_statistics())
@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 
 class NCRStatus(str, Enum):
@@ -73,7 +73,94 @@ class CAPAStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+# =============================================================================
+# Serialization
+# =============================================================================
+
+# (key, attribute, converter) — converter is None for values orjson encodes
+# natively, including the str enums above
+FieldSpec = tuple[str, str, Optional[Callable[[Any], Any]]]
+
+
+def _isoformat(value: Optional[date]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _serialize(obj: Any, fields: tuple[FieldSpec, ...]) -> dict[str, Any]:
+    """Build a JSON-ready dict from a precomputed field table."""
+    return {
+        key: conv(getattr(obj, attr)) if conv else getattr(obj, attr)
+        for key, attr, conv in fields
+    }
+
+
+_NCR_FIELDS: tuple[FieldSpec, ...] = (
+    ("id", "id", None),
+    ("ncr_number", "ncr_number", None),
+    ("status", "status", None),
+    ("severity", "severity", None),
+    ("source", "source", None),
+    ("title", "title", None),
+    ("description", "description", None),
+    ("part_number", "part_number", None),
+    ("lot_number", "lot_number", None),
+    ("quantity_affected", "quantity_affected", float),
+    ("disposition", "disposition", None),
+    ("root_cause", "root_cause", None),
+    ("capa_id", "capa_id", None),
+    ("capa_required", "capa_required", None),
+    ("estimated_cost", "estimated_cost", float),
+    ("created_at", "created_at", _isoformat),
+)
+
+_CAPA_FIELDS: tuple[FieldSpec, ...] = (
+    ("id", "id", None),
+    ("capa_number", "capa_number", None),
+    ("capa_type", "capa_type", None),
+    ("status", "status", None),
+    ("priority", "priority", None),
+    ("title", "title", None),
+    ("description", "description", None),
+    ("ncr_count", "ncr_ids", len),
+    ("root_causes", "root_causes", None),
+    ("owner_id", "owner_id", None),
+    ("due_date", "due_date", _isoformat),
+    ("eco_id", "eco_id", None),
+    ("created_at", "created_at", _isoformat),
+)
+
+_INSPECTION_FIELDS: tuple[FieldSpec, ...] = (
+    ("id", "id", None),
+    ("inspection_number", "inspection_number", None),
+    ("inspection_type", "inspection_type", None),
+    ("part_number", "part_number", None),
+    ("lot_number", "lot_number", None),
+    ("quantity_inspected", "quantity_inspected", float),
+    ("quantity_accepted", "quantity_accepted", float),
+    ("quantity_rejected", "quantity_rejected", float),
+    ("result", "result", None),
+    ("defect_count", "defects_found", len),
+    ("ncr_id", "ncr_id", None),
+    ("inspector_name", "inspector_name", None),
+    ("inspection_date", "inspection_date", _isoformat),
+)
+
+_HOLD_FIELDS: tuple[FieldSpec, ...] = (
+    ("id", "id", None),
+    ("hold_number", "hold_number", None),
+    ("part_number", "part_number", None),
+    ("lot_number", "lot_number", None),
+    ("quantity", "quantity", float),
+    ("reason", "reason", None),
+    ("hold_type", "hold_type", None),
+    ("is_active", "is_active", None),
+    ("ncr_id", "ncr_id", None),
+    ("placed_by", "placed_by", None),
+    ("placed_at", "placed_at", _isoformat),
+)
+
+
+@dataclass(slots=True)
 class NonConformanceReport:
     """
     Non-Conformance Report (NCR).
@@ -142,34 +229,33 @@ class NonConformanceReport:
     # Attachments
     attachments: list[str] = field(default_factory=list)
 
+    # Bumped by QualityService on every write
+    version: int = field(default=0, compare=False)
+
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.now()
         if self.detected_date is None:
             self.detected_date = date.today()
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "ncr_number": self.ncr_number,
-            "status": self.status.value,
-            "severity": self.severity.value,
-            "source": self.source.value,
-            "title": self.title,
-            "description": self.description,
-            "part_number": self.part_number,
-            "lot_number": self.lot_number,
-            "quantity_affected": float(self.quantity_affected),
-            "disposition": self.disposition.value if self.disposition else None,
-            "root_cause": self.root_cause,
-            "capa_id": self.capa_id,
-            "capa_required": self.capa_required,
-            "estimated_cost": float(self.estimated_cost),
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
-
-
-@dataclass
+    def to_dict(self, prefetched: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        """
+        Serialize the NCR.
+
+        If prefetched relations are supplied (see
+        QualityService.list_ncrs_with_relations), the linked CAPA and
+        active holds are summarized inline.
+        """
+        data = _serialize(self, _NCR_FIELDS)
+        if prefetched is not None:
+            capa = prefetched.get("capa")
+            data["capa_number"] = capa.capa_number if capa else None
+            data["capa_status"] = capa.status if capa else None
+            data["active_holds"] = [h.hold_number for h in prefetched.get("holds", [])]
+        return data
+
+
+@dataclass(slots=True)
 class CAPA:
     """
     Corrective and Preventive Action.
@@ -237,32 +323,31 @@ class CAPA:
     # Attachments
     attachments: list[str] = field(default_factory=list)
 
+    # Bumped by QualityService on every write
+    version: int = field(default=0, compare=False)
+
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.now()
         if self.initiated_date is None:
             self.initiated_date = date.today()
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "capa_number": self.capa_number,
-            "capa_type": self.capa_type.value,
-            "status": self.status.value,
-            "priority": self.priority,
-            "title": self.title,
-            "description": self.description,
-            "ncr_count": len(self.ncr_ids),
-            "root_causes": self.root_causes,
-            "action_count": len(self.corrective_actions) + len(self.preventive_actions),
-            "owner_id": self.owner_id,
-            "due_date": self.due_date.isoformat() if self.due_date else None,
-            "eco_id": self.eco_id,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
-
-
-@dataclass
+    def to_dict(self, prefetched: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        """
+        Serialize the CAPA.
+
+        If prefetched relations are supplied (see
+        QualityService.list_capas_with_relations), the linked NCR numbers
+        are included inline.
+        """
+        data = _serialize(self, _CAPA_FIELDS)
+        data["action_count"] = len(self.corrective_actions) + len(self.preventive_actions)
+        if prefetched is not None:
+            data["ncr_numbers"] = [n.ncr_number for n in prefetched.get("ncrs", [])]
+        return data
+
+
+@dataclass(slots=True)
 class InspectionRecord:
     """
     Inspection record for incoming/in-process/final inspection.
@@ -304,29 +389,18 @@ class InspectionRecord:
 
     created_at: Optional[datetime] = None
 
+    # Bumped by QualityService on every write
+    version: int = field(default=0, compare=False)
+
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.now()
 
     def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "inspection_number": self.inspection_number,
-            "inspection_type": self.inspection_type,
-            "part_number": self.part_number,
-            "lot_number": self.lot_number,
-            "quantity_inspected": float(self.quantity_inspected),
-            "quantity_accepted": float(self.quantity_accepted),
-            "quantity_rejected": float(self.quantity_rejected),
-            "result": self.result,
-            "defect_count": len(self.defects_found),
-            "ncr_id": self.ncr_id,
-            "inspector_name": self.inspector_name,
-            "inspection_date": self.inspection_date.isoformat() if self.inspection_date else None,
-        }
-
-
-@dataclass
+        return _serialize(self, _INSPECTION_FIELDS)
+
+
+@dataclass(slots=True)
 class QualityHold:
     """
     Quality hold on parts/materials.
@@ -357,21 +431,12 @@ class QualityHold:
     released_at: Optional[datetime] = None
     release_notes: Optional[str] = None
 
+    # Bumped by QualityService on every write
+    version: int = field(default=0, compare=False)
+
     def __post_init__(self):
         if self.placed_at is None:
             self.placed_at = datetime.now()
 
     def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "hold_number": self.hold_number,
-            "part_number": self.part_number,
-            "lot_number": self.lot_number,
-            "quantity": float(self.quantity),
-            "reason": self.reason,
-            "hold_type": self.hold_type,
-            "is_active": self.is_active,
-            "ncr_id": self.ncr_id,
-            "placed_by": self.placed_by,
-            "placed_at": self.placed_at.isoformat() if self.placed_at else None,
-        }
+        return _serialize(self, _HOLD_FIELDS)
@@ -4,12 +4,16 @@ Quality Service
 Centralized service for quality management operations.
 """
 
+import heapq
 import logging
+import time
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Iterable, Optional, TypeVar, Union
 from uuid import uuid4
 
+import orjson
+
 from .models import (
     CAPA,
     CAPAStatus,
@@ -25,6 +29,36 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+QualityRecord = Union[NonConformanceReport, CAPA, InspectionRecord, QualityHold]
+RecordT = TypeVar("RecordT", bound=QualityRecord)
+
+# Upper bound on how stale cached statistics may be. Writes through the
+# service invalidate immediately; the TTL covers date-dependent counts
+# (e.g. overdue CAPAs) and records mutated outside the service.
+STATISTICS_TTL_SECONDS = 30.0
+
+
+def _filter_latest(
+    records: Iterable[RecordT],
+    criteria: Iterable[tuple[str, Any]],
+    sort_attr: str,
+    limit: int,
+) -> list[RecordT]:
+    """
+    Filter records in one pass and return the newest `limit` of them.
+
+    Criteria are (attribute, value) pairs; pairs with a falsy value are
+    ignored, matching the optional filters of the list methods.
+    """
+    active = [(attr, value) for attr, value in criteria if value]
+    matches = (
+        r for r in records
+        if all(getattr(r, attr) == value for attr, value in active)
+    )
+    return heapq.nlargest(
+        limit, matches, key=lambda r: getattr(r, sort_attr) or datetime.min
+    )
+
 
 class QualityService:
     """
@@ -44,6 +78,12 @@ class QualityService:
         self._inspection_counter = 0
         self._hold_counter = 0
 
+        # (computed_at, statistics) from time.monotonic()
+        self._statistics_cache: Optional[tuple[float, dict[str, Any]]] = None
+
+        # record ID -> (version, encoded to_dict())
+        self._json_cache: dict[str, tuple[int, bytes]] = {}
+
     # =========================================================================
     # NCR Management
     # =========================================================================
@@ -101,6 +141,7 @@ class QualityService:
                 placed_by=created_by,
             )
 
+        self._mark_changed(ncr)
         return ncr
 
     def get_ncr(self, ncr_id: str) -> Optional[NonConformanceReport]:
@@ -111,24 +152,66 @@ class QualityService:
         self,
         status: Optional[NCRStatus] = None,
         severity: Optional[NCRSeverity] = None,
+        source: Optional[NCRSource] = None,
         part_number: Optional[str] = None,
         project_id: Optional[str] = None,
         limit: int = 100,
     ) -> list[NonConformanceReport]:
         """List NCRs with filters."""
-        ncrs = list(self._ncrs.values())
+        criteria = (
+            ("status", status),
+            ("severity", severity),
+            ("source", source),
+            ("part_number", part_number),
+            ("project_id", project_id),
+        )
+        return _filter_latest(self._ncrs.values(), criteria, "created_at", limit)
 
-        if status:
-            ncrs = [n for n in ncrs if n.status == status]
-        if severity:
-            ncrs = [n for n in ncrs if n.severity == severity]
-        if part_number:
-            ncrs = [n for n in ncrs if n.part_number == part_number]
-        if project_id:
-            ncrs = [n for n in ncrs if n.project_id == project_id]
+    def list_ncrs_with_relations(
+        self,
+        status: Optional[NCRStatus] = None,
+        severity: Optional[NCRSeverity] = None,
+        source: Optional[NCRSource] = None,
+        part_number: Optional[str] = None,
+        project_id: Optional[str] = None,
+        limit: int = 100,
+    ) -> tuple[list[NonConformanceReport], dict[str, dict[str, Any]]]:
+        """
+        List NCRs along with their linked CAPAs and active holds.
+
+        Relations are fetched in one batch for the whole page (keyed by
+        NCR ID) rather than looked up per NCR.
+
+        Returns:
+            (ncrs, prefetched) where prefetched maps NCR ID to
+            {"capa": CAPA | None, "holds": list[QualityHold]}
+        """
+        ncrs = self.list_ncrs(
+            status=status,
+            severity=severity,
+            source=source,
+            part_number=part_number,
+            project_id=project_id,
+            limit=limit,
+        )
 
-        ncrs.sort(key=lambda n: n.created_at or datetime.min, reverse=True)
-        return ncrs[:limit]
+        ncr_ids = {n.id for n in ncrs}
+        capa_ids = {n.capa_id for n in ncrs if n.capa_id}
+        capas = {cid: self._capas[cid] for cid in capa_ids if cid in self._capas}
+
+        holds_by_ncr: dict[str, list[QualityHold]] = {}
+        for hold in self._holds.values():
+            if hold.is_active and hold.ncr_id in ncr_ids:
+                holds_by_ncr.setdefault(hold.ncr_id, []).append(hold)
+
+        prefetched = {
+            n.id: {
+                "capa": capas.get(n.capa_id) if n.capa_id else None,
+                "holds": holds_by_ncr.get(n.id, []),
+            }
+            for n in ncrs
+        }
+        return ncrs, prefetched
 
     def update_ncr_status(
         self,
@@ -152,6 +235,7 @@ class QualityService:
                 if hold.ncr_id == ncr_id and hold.is_active:
                     self.release_hold(hold.id, user_id, "NCR closed")
 
+        self._mark_changed(ncr)
         return ncr
 
     def set_disposition(
@@ -172,6 +256,7 @@ class QualityService:
         ncr.disposition_notes = notes
         ncr.status = NCRStatus.DISPOSITION_APPROVED
 
+        self._mark_changed(ncr)
         return ncr
 
     def link_capa(
@@ -191,7 +276,9 @@ class QualityService:
         capa = self.get_capa(capa_id)
         if capa and ncr_id not in capa.ncr_ids:
             capa.ncr_ids.append(ncr_id)
+            self._mark_changed(capa)
 
+        self._mark_changed(ncr)
         return ncr
 
     # =========================================================================
@@ -233,12 +320,15 @@ class QualityService:
         logger.info(f"Created CAPA {capa_number}")
 
         # Link NCRs to this CAPA
+        linked = []
         for ncr_id in capa.ncr_ids:
             ncr = self.get_ncr(ncr_id)
             if ncr:
                 ncr.capa_id = capa.id
                 ncr.capa_required = True
+                linked.append(ncr)
 
+        self._mark_changed(capa, *linked)
         return capa
 
     def get_capa(self, capa_id: str) -> Optional[CAPA]:
@@ -249,21 +339,53 @@ class QualityService:
         self,
         status: Optional[CAPAStatus] = None,
         capa_type: Optional[CAPAType] = None,
+        priority: Optional[str] = None,
         owner_id: Optional[str] = None,
         limit: int = 100,
     ) -> list[CAPA]:
         """List CAPAs with filters."""
-        capas = list(self._capas.values())
+        criteria = (
+            ("status", status),
+            ("capa_type", capa_type),
+            ("priority", priority),
+            ("owner_id", owner_id),
+        )
+        return _filter_latest(self._capas.values(), criteria, "created_at", limit)
+
+    def list_capas_with_relations(
+        self,
+        status: Optional[CAPAStatus] = None,
+        capa_type: Optional[CAPAType] = None,
+        priority: Optional[str] = None,
+        owner_id: Optional[str] = None,
+        limit: int = 100,
+    ) -> tuple[list[CAPA], dict[str, dict[str, Any]]]:
+        """
+        List CAPAs along with their linked NCRs.
+
+        NCR IDs are collected across the whole page and resolved in one
+        batch rather than per CAPA.
+
+        Returns:
+            (capas, prefetched) where prefetched maps CAPA ID to
+            {"ncrs": list[NonConformanceReport]}
+        """
+        capas = self.list_capas(
+            status=status,
+            capa_type=capa_type,
+            priority=priority,
+            owner_id=owner_id,
+            limit=limit,
+        )
 
-        if status:
-            capas = [c for c in capas if c.status == status]
-        if capa_type:
-            capas = [c for c in capas if c.capa_type == capa_type]
-        if owner_id:
-            capas = [c for c in capas if c.owner_id == owner_id]
+        ncr_ids = {nid for c in capas for nid in c.ncr_ids}
+        ncrs = {nid: self._ncrs[nid] for nid in ncr_ids if nid in self._ncrs}
 
-        capas.sort(key=lambda c: c.created_at or datetime.min, reverse=True)
-        return capas[:limit]
+        prefetched = {
+            c.id: {"ncrs": [ncrs[nid] for nid in c.ncr_ids if nid in ncrs]}
+            for c in capas
+        }
+        return capas, prefetched
 
     def update_capa_status(
         self,
@@ -282,6 +404,7 @@ class QualityService:
             capa.closed_date = datetime.now()
             capa.closed_by = user_id
 
+        self._mark_changed(capa)
         return capa
 
     def add_root_cause(
@@ -299,6 +422,7 @@ class QualityService:
         if analysis_method:
             capa.root_cause_method = analysis_method
 
+        self._mark_changed(capa)
         return capa
 
     def add_action(
@@ -330,6 +454,7 @@ class QualityService:
         elif action_type == "preventive":
             capa.preventive_actions.append(action)
 
+        self._mark_changed(capa)
         return capa
 
     def verify_capa(
@@ -350,8 +475,32 @@ class QualityService:
         capa.verified_date = datetime.now()
         capa.status = CAPAStatus.EFFECTIVENESS_REVIEW
 
+        self._mark_changed(capa)
+        return capa
+
+    def review_effectiveness(
+        self,
+        capa_id: str,
+        effective: bool,
+        result: str,
+    ) -> Optional[CAPA]:
+        """Record CAPA effectiveness review; ineffective actions reopen implementation."""
+        capa = self.get_capa(capa_id)
+        if not capa:
+            return None
+
+        capa.effectiveness_review_date = date.today()
+        capa.effectiveness_result = result
+        if not effective:
+            capa.status = CAPAStatus.IMPLEMENTATION
+
+        self._mark_changed(capa)
         return capa
 
+    def close_capa(self, capa_id: str, closed_by: str) -> Optional[CAPA]:
+        """Close a CAPA."""
+        return self.update_capa_status(capa_id, CAPAStatus.CLOSED, closed_by)
+
     # =========================================================================
     # Inspection Management
     # =========================================================================
@@ -384,6 +533,7 @@ class QualityService:
         )
 
         self._inspections[inspection.id] = inspection
+        self._mark_changed(inspection)
         return inspection
 
     def complete_inspection(
@@ -427,6 +577,7 @@ class QualityService:
             )
             inspection.ncr_id = ncr.id
 
+        self._mark_changed(inspection)
         return inspection
 
     def get_inspection(self, inspection_id: str) -> Optional[InspectionRecord]:
@@ -438,20 +589,17 @@ class QualityService:
         inspection_type: Optional[str] = None,
         result: Optional[str] = None,
         part_number: Optional[str] = None,
+        lot_number: Optional[str] = None,
         limit: int = 100,
     ) -> list[InspectionRecord]:
         """List inspections with filters."""
-        inspections = list(self._inspections.values())
-
-        if inspection_type:
-            inspections = [i for i in inspections if i.inspection_type == inspection_type]
-        if result:
-            inspections = [i for i in inspections if i.result == result]
-        if part_number:
-            inspections = [i for i in inspections if i.part_number == part_number]
-
-        inspections.sort(key=lambda i: i.created_at or datetime.min, reverse=True)
-        return inspections[:limit]
+        criteria = (
+            ("inspection_type", inspection_type),
+            ("result", result),
+            ("part_number", part_number),
+            ("lot_number", lot_number),
+        )
+        return _filter_latest(self._inspections.values(), criteria, "created_at", limit)
 
     # =========================================================================
     # Hold Management
@@ -488,6 +636,7 @@ class QualityService:
         self._holds[hold.id] = hold
         logger.info(f"Created hold {hold_number}")
 
+        self._mark_changed(hold)
         return hold
 
     def release_hold(
@@ -508,6 +657,7 @@ class QualityService:
 
         logger.info(f"Released hold {hold.hold_number}")
 
+        self._mark_changed(hold)
         return hold
 
     def get_hold(self, hold_id: str) -> Optional[QualityHold]:
@@ -518,18 +668,18 @@ class QualityService:
         self,
         active_only: bool = False,
         part_number: Optional[str] = None,
+        lot_number: Optional[str] = None,
+        hold_type: Optional[str] = None,
         limit: int = 100,
     ) -> list[QualityHold]:
         """List quality holds."""
-        holds = list(self._holds.values())
-
-        if active_only:
-            holds = [h for h in holds if h.is_active]
-        if part_number:
-            holds = [h for h in holds if h.part_number == part_number]
-
-        holds.sort(key=lambda h: h.placed_at or datetime.min, reverse=True)
-        return holds[:limit]
+        criteria = (
+            ("is_active", active_only),
+            ("part_number", part_number),
+            ("lot_number", lot_number),
+            ("hold_type", hold_type),
+        )
+        return _filter_latest(self._holds.values(), criteria, "placed_at", limit)
 
     # =========================================================================
     # Statistics
@@ -537,31 +687,86 @@ class QualityService:
 
     def get_quality_metrics(self) -> dict:
         """Get quality metrics summary."""
-        open_ncrs = [n for n in self._ncrs.values() if n.status not in [NCRStatus.CLOSED, NCRStatus.VOIDED]]
-        open_capas = [c for c in self._capas.values() if c.status != CAPAStatus.CLOSED]
-        active_holds = [h for h in self._holds.values() if h.is_active]
+        today = date.today()
+
+        open_ncrs = critical_ncrs = pending_disposition = 0
+        for ncr in self._ncrs.values():
+            if ncr.status in (NCRStatus.CLOSED, NCRStatus.VOIDED):
+                continue
+            open_ncrs += 1
+            if ncr.severity == NCRSeverity.CRITICAL:
+                critical_ncrs += 1
+            if ncr.status == NCRStatus.PENDING_DISPOSITION:
+                pending_disposition += 1
+
+        open_capas = overdue_capas = 0
+        for capa in self._capas.values():
+            if capa.status == CAPAStatus.CLOSED:
+                continue
+            open_capas += 1
+            if capa.due_date and capa.due_date < today:
+                overdue_capas += 1
+
+        failed_inspections = sum(1 for i in self._inspections.values() if i.result == "fail")
+        active_holds = sum(1 for h in self._holds.values() if h.is_active)
 
         return {
             "ncrs": {
                 "total": len(self._ncrs),
-                "open": len(open_ncrs),
-                "critical": len([n for n in open_ncrs if n.severity == NCRSeverity.CRITICAL]),
-                "pending_disposition": len([n for n in open_ncrs if n.status == NCRStatus.PENDING_DISPOSITION]),
+                "open": open_ncrs,
+                "critical": critical_ncrs,
+                "pending_disposition": pending_disposition,
             },
             "capas": {
                 "total": len(self._capas),
-                "open": len(open_capas),
-                "overdue": len([c for c in open_capas if c.due_date and c.due_date < date.today()]),
+                "open": open_capas,
+                "overdue": overdue_capas,
             },
             "inspections": {
                 "total": len(self._inspections),
-                "failed": len([i for i in self._inspections.values() if i.result == "fail"]),
+                "failed": failed_inspections,
             },
             "holds": {
-                "active": len(active_holds),
+                "active": active_holds,
             },
         }
 
+    def get_statistics(self) -> dict[str, Any]:
+        """
+        Get quality metrics, cached for up to STATISTICS_TTL_SECONDS.
+
+        The returned dict is shared between callers and must not be mutated.
+        """
+        now = time.monotonic()
+        cached = self._statistics_cache
+        if cached is not None and now - cached[0] < STATISTICS_TTL_SECONDS:
+            return cached[1]
+
+        stats = self.get_quality_metrics()
+        self._statistics_cache = (now, stats)
+        return stats
+
+    def to_json(self, record: QualityRecord) -> bytes:
+        """
+        Get the encoded to_dict() of a record, cached per record version.
+
+        Cache entries are keyed by record ID and replaced once the version
+        moves on, so only writes made through the service are picked up.
+        """
+        cached = self._json_cache.get(record.id)
+        if cached is not None and cached[0] == record.version:
+            return cached[1]
+
+        encoded = orjson.dumps(record.to_dict())
+        self._json_cache[record.id] = (record.version, encoded)
+        return encoded
+
+    def _mark_changed(self, *records: QualityRecord) -> None:
+        """Bump record versions and drop cached statistics after a write."""
+        for record in records:
+            record.version += 1
+        self._statistics_cache = None
+
 
 # Singleton instance
 _service: Optional[QualityService] = None
@@ -0,0 +1,68 @@
+"""
+Test Database Helpers
+
+Shared factory for the in-memory SQLite engines used by the test suite.
+"""
+
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import Connection, StaticPool, create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+# Connection the app's database sessions join during API tests
+api_connection: ContextVar[Optional[Connection]] = ContextVar("api_connection", default=None)
+
+
+def _configure_sqlite(engine: Engine) -> None:
+    """Register connection hooks tuning SQLite for throwaway test databases."""
+
+    # pysqlite's implicit transaction handling breaks SAVEPOINT; let
+    # SQLAlchemy emit BEGIN itself so each test can be rolled back.
+    # Durability is irrelevant for an in-memory database, so skip journal,
+    # fsync and file-lock bookkeeping as well.
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+def create_test_engine() -> Engine:
+    """
+    Create an in-memory SQLite engine backed by a single shared connection.
+
+    StaticPool keeps one connection for the life of the engine, so the
+    schema survives across sessions and threads (FastAPI runs sync handlers
+    in a worker thread).
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    _configure_sqlite(engine)
+    return engine
+
+
+def override_get_db():
+    """Database dependency override joining the current api_connection."""
+    db = Session(
+        bind=api_connection.get(),
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+        autoflush=False,
+    )
+    try:
+        yield db
+    finally:
+        db.close()
@@ -0,0 +1,20 @@
+"""
+Test ID Helpers
+
+Cheap, process-unique IDs for test rows and lookups.
+"""
+
+import itertools
+
+_counter = itertools.count()
+
+
+def next_id(prefix: str = "test") -> str:
+    """
+    Return the next ID from a process-wide counter.
+
+    The schema treats IDs as opaque strings, so tests do not need
+    uuid4()'s randomness; a counter stays unique across every module
+    sharing a database without touching os.urandom.
+    """
+    return f"{prefix}-{next(_counter):08d}"
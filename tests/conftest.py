@@ -4,13 +4,15 @@ Test Configuration and Fixtures
 Provides database fixtures and test data for PLM tests.
 """
 
+import os
 import pytest
 from datetime import datetime, date
 from decimal import Decimal
-from uuid import uuid4
+from types import MappingProxyType
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
 
 from plm.db.base import Base
 from plm.db.models import (
@@ -22,23 +24,138 @@ from plm.db.models import (
 from plm.parts.models import Part, PartType, PartStatus, UnitOfMeasure
 from plm.boms.models import BOM, BOMItem, BOMType, Effectivity
 
+from tests._db import api_connection, create_test_engine, override_get_db
+from tests._ids import next_id
 
-@pytest.fixture(scope="function")
-def engine():
-    """Create a fresh in-memory database for each test."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
+
+@pytest.fixture(scope="session")
+def build_schema():
+    """
+    Return a callable creating the PLM tables on an engine.
+
+    The DDL runs once per session, into a pristine in-memory template;
+    each engine then receives a page-level copy of it through SQLite's
+    backup API. Memoized by engine, however many fixtures ask for it.
+    """
+    template = create_test_engine()
+    Base.metadata.create_all(template)
+    built: set[int] = set()
+
+    def _build(engine) -> None:
+        if id(engine) not in built:
+            with template.connect() as source, engine.connect() as target:
+                source.connection.dbapi_connection.backup(target.connection.dbapi_connection)
+            built.add(id(engine))
+
+    yield _build
+    template.dispose()
+
+
+@pytest.fixture(scope="session")
+def engine(build_schema):
+    """Create a single in-memory database shared by the test session."""
+    engine = create_test_engine()
+    build_schema(engine)
     yield engine
     Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def connection(engine):
+    """Open a connection whose transaction spans the test module."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture(scope="function")
-def session(engine):
-    """Create a new database session for each test."""
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
+def session(connection):
+    """Create a database session rolled back at the end of each test."""
+    savepoint = connection.begin_nested()
+    session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+        autoflush=False,
+    )
     yield session
     session.close()
+    savepoint.rollback()
+
+
+# =============================================================================
+# API Fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Import the PLM FastAPI application once per test session."""
+    from plm.api.app import app
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def _api_db_override(app):
+    """Point the app's database dependency at the shared test connection."""
+    from plm.api.deps import get_db_session
+
+    app.dependency_overrides[get_db_session] = override_get_db
+    yield
+    app.dependency_overrides.pop(get_db_session, None)
+
+
+@pytest.fixture
+async def api_db(connection, _api_db_override):
+    """
+    Run the test's API requests in a savepoint rolled back afterwards.
+
+    Async so the ContextVar is set in the event loop's context, where the
+    app resolves its dependencies.
+    """
+    savepoint = connection.begin_nested()
+    token = api_connection.set(connection)
+    yield connection
+    api_connection.reset(token)
+    savepoint.rollback()
+
+
+@pytest.fixture(scope="session")
+def api_headers():
+    """Read-only auth headers matching the app's configured API key."""
+    return MappingProxyType({"X-API-Key": os.environ.get("PLM_API_KEY", "dev-key")})
+
+
+@pytest.fixture(scope="session")
+def json_headers(api_headers):
+    """api_headers plus the JSON content type, for pre-encoded request bodies."""
+    return MappingProxyType({**api_headers, "Content-Type": "application/json"})
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run anyio-marked tests and fixtures on asyncio."""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def client(app):
+    """
+    Async HTTP client calling the app in-process over ASGI.
+
+    Shared by the whole session. Tests using it are marked anyio and
+    request api_db for their database.
+    """
+    transport = ASGITransport(app=app)
+    # Follow trailing-slash redirects the way Starlette's TestClient did
+    async with AsyncClient(
+        transport=transport, base_url="http://test", follow_redirects=True
+    ) as c:
+        yield c
 
 
 # =============================================================================
@@ -50,7 +167,7 @@ def session(engine):
 def sample_part() -> Part:
     """Create a sample part."""
     return Part(
-        id=str(uuid4()),
+        id=next_id(),
         part_number="LUMBER-2X4-8FT",
         revision="A",
         name="2x4x8 Lumber",
@@ -67,70 +184,69 @@ def sample_part() -> Part:
     )
 
 
+def _part_rows() -> list[dict]:
+    """Rows for the lumber, nails and wall assembly parts."""
+    return [
+        {
+            "id": next_id(),
+            "part_number": "LUMBER-2X4-8FT",
+            "revision": "A",
+            "name": "2x4x8 Lumber",
+            "part_type": PartType.RAW_MATERIAL,
+            "status": PartStatus.RELEASED,
+            "category": "06 - Wood",
+            "unit_of_measure": UnitOfMeasure.EACH,
+            "unit_cost": Decimal("8.99"),
+        },
+        {
+            "id": next_id(),
+            "part_number": "NAIL-16D-BOX",
+            "revision": "A",
+            "name": "16d Framing Nails (Box)",
+            "part_type": PartType.RAW_MATERIAL,
+            "status": PartStatus.RELEASED,
+            "category": "05 - Metals",
+            "unit_of_measure": UnitOfMeasure.EACH,
+            "unit_cost": Decimal("45.00"),
+        },
+        {
+            "id": next_id(),
+            "part_number": "WALL-ASSY-EXT-8FT",
+            "revision": "A",
+            "name": "Exterior Wall Assembly 8ft",
+            "part_type": PartType.ASSEMBLY,
+            "status": PartStatus.DRAFT,
+            "category": "06 - Wood",
+            "unit_of_measure": UnitOfMeasure.LINEAR_FEET,
+        },
+    ]
+
+
+@pytest.fixture(scope="module")
+def seeded_parts(connection) -> list[str]:
+    """
+    Persist the lumber, nails and wall assembly parts once per module.
+
+    Returns the part IDs; tests use multiple_parts to load them into their
+    own session so their writes still roll back with it.
+    """
+    rows = _part_rows()
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as seed:
+        seed.execute(insert(PartModel), rows)
+        seed.commit()
+    return [row["id"] for row in rows]
+
+
 @pytest.fixture
-def sample_part_model(session, sample_part) -> PartModel:
-    """Create and persist a sample part model."""
-    model = PartModel(
-        id=sample_part.id,
-        part_number=sample_part.part_number,
-        revision=sample_part.revision,
-        name=sample_part.name,
-        description=sample_part.description,
-        part_type=sample_part.part_type,
-        status=sample_part.status,
-        category=sample_part.category,
-        csi_code=sample_part.csi_code,
-        unit_of_measure=sample_part.unit_of_measure,
-        unit_cost=sample_part.unit_cost,
-        manufacturer=sample_part.manufacturer,
-        lead_time_days=sample_part.lead_time_days,
-        created_by=sample_part.created_by,
-    )
-    session.add(model)
-    session.commit()
-    return model
+def multiple_parts(session, seeded_parts) -> list[PartModel]:
+    """Load the module-seeded parts into the test's session."""
+    return [session.get(PartModel, part_id) for part_id in seeded_parts]
 
 
 @pytest.fixture
-def multiple_parts(session) -> list[PartModel]:
-    """Create multiple parts for testing."""
-    parts = [
-        PartModel(
-            id=str(uuid4()),
-            part_number="LUMBER-2X4-8FT",
-            revision="A",
-            name="2x4x8 Lumber",
-            part_type=PartType.RAW_MATERIAL,
-            status=PartStatus.RELEASED,
-            category="06 - Wood",
-            unit_of_measure=UnitOfMeasure.EACH,
-            unit_cost=Decimal("8.99"),
-        ),
-        PartModel(
-            id=str(uuid4()),
-            part_number="NAIL-16D-BOX",
-            revision="A",
-            name="16d Framing Nails (Box)",
-            part_type=PartType.RAW_MATERIAL,
-            status=PartStatus.RELEASED,
-            category="05 - Metals",
-            unit_of_measure=UnitOfMeasure.EACH,
-            unit_cost=Decimal("45.00"),
-        ),
-        PartModel(
-            id=str(uuid4()),
-            part_number="WALL-ASSY-EXT-8FT",
-            revision="A",
-            name="Exterior Wall Assembly 8ft",
-            part_type=PartType.ASSEMBLY,
-            status=PartStatus.DRAFT,
-            category="06 - Wood",
-            unit_of_measure=UnitOfMeasure.LINEAR_FEET,
-        ),
-    ]
-    session.add_all(parts)
-    session.commit()
-    return parts
+def sample_part_model(multiple_parts) -> PartModel:
+    """The module-seeded lumber part, loaded into the test's session."""
+    return multiple_parts[0]
 
 
 # =============================================================================
@@ -138,54 +254,65 @@ def multiple_parts(session) -> list[PartModel]:
 # =============================================================================
 
 
-@pytest.fixture
-def sample_bom(multiple_parts, session) -> BOMModel:
-    """Create a sample BOM with items."""
-    assembly = multiple_parts[2]  # Wall assembly
-    lumber = multiple_parts[0]
-    nails = multiple_parts[1]
-
-    bom = BOMModel(
-        id=str(uuid4()),
-        bom_number="BOM-WALL-EXT-001",
-        revision="A",
-        name="8ft Exterior Wall BOM",
-        description="Bill of materials for 8ft exterior wall section",
-        parent_part_id=assembly.id,
-        parent_part_revision="A",
-        bom_type=BOMType.ENGINEERING,
-        effectivity=Effectivity.AS_DESIGNED,
-        status=PartStatus.DRAFT,
-        created_by="test",
-    )
-    session.add(bom)
-    session.flush()
+def _bom_rows(parts: list[PartModel]) -> tuple[dict, list[dict]]:
+    """Rows for the exterior wall BOM and its items over _part_rows() parts."""
+    assembly = parts[2]  # Wall assembly
+    lumber = parts[0]
+    nails = parts[1]
 
+    bom = {
+        "id": next_id(),
+        "bom_number": "BOM-WALL-EXT-001",
+        "revision": "A",
+        "name": "8ft Exterior Wall BOM",
+        "description": "Bill of materials for 8ft exterior wall section",
+        "parent_part_id": assembly.id,
+        "parent_part_revision": "A",
+        "bom_type": BOMType.ENGINEERING,
+        "effectivity": Effectivity.AS_DESIGNED,
+        "status": PartStatus.DRAFT,
+        "created_by": "test",
+    }
     items = [
-        BOMItemModel(
-            id=str(uuid4()),
-            bom_id=bom.id,
-            part_id=lumber.id,
-            part_number=lumber.part_number,
-            part_revision="A",
-            quantity=Decimal("12"),
-            unit_of_measure=UnitOfMeasure.EACH,
-            find_number=10,
-            reference_designator="STUD-01-12",
-        ),
-        BOMItemModel(
-            id=str(uuid4()),
-            bom_id=bom.id,
-            part_id=nails.id,
-            part_number=nails.part_number,
-            part_revision="A",
-            quantity=Decimal("0.5"),
-            unit_of_measure=UnitOfMeasure.EACH,
-            find_number=20,
-            reference_designator="FASTENER-01",
-        ),
+        {
+            "id": next_id(),
+            "bom_id": bom["id"],
+            "part_id": lumber.id,
+            "part_number": lumber.part_number,
+            "part_revision": "A",
+            "quantity": Decimal("12"),
+            "unit_of_measure": UnitOfMeasure.EACH,
+            "find_number": 10,
+            "reference_designator": "STUD-01-12",
+        },
+        {
+            "id": next_id(),
+            "bom_id": bom["id"],
+            "part_id": nails.id,
+            "part_number": nails.part_number,
+            "part_revision": "A",
+            "quantity": Decimal("0.5"),
+            "unit_of_measure": UnitOfMeasure.EACH,
+            "find_number": 20,
+            "reference_designator": "FASTENER-01",
+        },
     ]
-    session.add_all(items)
-    session.commit()
 
-    return bom
+    return bom, items
+
+
+@pytest.fixture(scope="module")
+def seeded_bom(connection, seeded_parts) -> str:
+    """Persist the exterior wall BOM and its items once per module; returns its ID."""
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as seed:
+        bom_row, item_rows = _bom_rows([seed.get(PartModel, part_id) for part_id in seeded_parts])
+        seed.execute(insert(BOMModel), [bom_row])
+        seed.execute(insert(BOMItemModel), item_rows)
+        seed.commit()
+    return bom_row["id"]
+
+
+@pytest.fixture
+def sample_bom(session, seeded_bom) -> BOMModel:
+    """Load the module-seeded BOM into the test's session."""
+    return session.get(BOMModel, seeded_bom)
@@ -1,251 +1,185 @@
 """
 API Router Tests
 
-Tests for FastAPI routers using TestClient.
+Tests for FastAPI routers using an in-process ASGI client.
 """
 
 import pytest
-from uuid import uuid4
+from collections.abc import Mapping
 
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, StaticPool
-from sqlalchemy.orm import sessionmaker
+from tests._db import api_connection
+from tests._ids import next_id
 
-from plm.db.base import Base
 
+# Every test's requests run in a savepoint rolled back afterwards
+pytestmark = pytest.mark.usefixtures("api_db")
 
-# Create test database engine - use StaticPool to share connection across threads
-test_engine = create_engine(
-    "sqlite:///:memory:",
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
-TestSessionLocal = sessionmaker(bind=test_engine, autocommit=False, autoflush=False)
 
-# Create all tables
-Base.metadata.create_all(bind=test_engine)
-
-
-def override_get_db():
-    """Override database dependency for tests."""
-    db = TestSessionLocal()
+async def _create_shared(client, connection, url: str, payload: dict, headers: Mapping) -> dict:
+    """POST a resource into the module's transaction and return its body."""
+    token = api_connection.set(connection)
     try:
-        yield db
+        response = await client.post(url, json=payload, headers=headers)
     finally:
-        db.close()
+        api_connection.reset(token)
+    assert response.status_code in [200, 201]
+    return response.json()
 
 
 @pytest.fixture(scope="module")
-def client():
-    """Create test client with dependency override."""
-    from plm.api.app import app
-    from plm.api.deps import get_db_session
-
-    app.dependency_overrides[get_db_session] = override_get_db
-    with TestClient(app) as c:
-        yield c
-    app.dependency_overrides.clear()
+async def created_requirement(client, connection, _api_db_override, api_headers) -> dict:
+    """Requirement created once and shared by the module's read-only tests."""
+    return await _create_shared(
+        client,
+        connection,
+        "/api/v1/requirements/",
+        {
+            "requirement_number": "REQ-API-002",
+            "requirement_type": "performance",
+            "title": "Get Test Requirement",
+        },
+        api_headers,
+    )
 
 
-@pytest.fixture
-def api_headers():
-    """API headers with auth key."""
-    return {"X-API-Key": "dev-key"}
+@pytest.fixture(scope="module")
+async def created_project(client, connection, _api_db_override, api_headers) -> dict:
+    """Project created once and shared by the module's read-only tests."""
+    return await _create_shared(
+        client,
+        connection,
+        "/api/v1/projects/",
+        {"project_number": "PRJ-API-002", "name": "Get Test Project"},
+        api_headers,
+    )
 
 
 # =============================================================================
-# Requirements Router Tests
+# Endpoint Smoke Tests
 # =============================================================================
 
-
-class TestRequirementsRouter:
-    """Tests for requirements API endpoints."""
-
-    def test_list_requirements(self, client, api_headers):
-        """Test listing requirements."""
-        response = client.get("/api/v1/requirements/", headers=api_headers)
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-
-    def test_create_requirement(self, client, api_headers):
-        """Test creating a requirement."""
-        data = {
+LIST_ENDPOINTS = [
+    "/api/v1/requirements/",
+    "/api/v1/suppliers/manufacturers/",
+    "/api/v1/suppliers/vendors/",
+    "/api/v1/compliance/regulations",
+    "/api/v1/compliance/certificates",
+    "/api/v1/costing/variances",
+    "/api/v1/bulletins",
+    "/api/v1/bulletins/maintenance/schedules",
+    "/api/v1/bulletins/units",
+    "/api/v1/projects/",
+]
+
+# (url, payload, fields expected to be echoed back)
+CREATE_CASES = [
+    (
+        "/api/v1/requirements/",
+        {
             "requirement_number": "REQ-API-001",
             "requirement_type": "functional",
             "title": "API Test Requirement",
             "description": "Created via API test",
             "priority": "must_have",
-        }
-        response = client.post("/api/v1/requirements/", json=data, headers=api_headers)
-        assert response.status_code in [200, 201]
-        result = response.json()
-        assert result["requirement_number"] == "REQ-API-001"
-        assert result["title"] == "API Test Requirement"
-        return result["id"]
-
-    def test_get_requirement(self, client, api_headers):
-        """Test getting a specific requirement."""
-        # First create one
-        data = {
-            "requirement_number": "REQ-API-002",
-            "requirement_type": "performance",
-            "title": "Get Test Requirement",
-        }
-        create_resp = client.post("/api/v1/requirements/", json=data, headers=api_headers)
-        req_id = create_resp.json()["id"]
-
-        # Now get it
-        response = client.get(f"/api/v1/requirements/{req_id}", headers=api_headers)
-        assert response.status_code == 200
-        assert response.json()["requirement_number"] == "REQ-API-002"
-
-    def test_get_nonexistent_requirement(self, client, api_headers):
-        """Test getting a nonexistent requirement returns 404."""
-        response = client.get(f"/api/v1/requirements/{uuid4()}", headers=api_headers)
-        assert response.status_code == 404
-
-
-# =============================================================================
-# Suppliers Router Tests
-# =============================================================================
-
-
-class TestSuppliersRouter:
-    """Tests for suppliers API endpoints."""
-
-    def test_list_manufacturers(self, client, api_headers):
-        """Test listing manufacturers."""
-        response = client.get("/api/v1/suppliers/manufacturers/", headers=api_headers)
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-
-    def test_create_manufacturer(self, client, api_headers):
-        """Test creating a manufacturer."""
-        data = {
+        },
+        ["requirement_number", "title"],
+    ),
+    (
+        "/api/v1/suppliers/manufacturers/",
+        {
             "manufacturer_code": "MFG-API-001",
             "name": "API Test Manufacturer",
             "country": "USA",
-        }
-        response = client.post(
-            "/api/v1/suppliers/manufacturers/", json=data, headers=api_headers
-        )
-        assert response.status_code in [200, 201]
-        result = response.json()
-        assert result["manufacturer_code"] == "MFG-API-001"
-        assert result["name"] == "API Test Manufacturer"
-
-    def test_list_vendors(self, client, api_headers):
-        """Test listing vendors."""
-        response = client.get("/api/v1/suppliers/vendors/", headers=api_headers)
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-
-    def test_create_vendor(self, client, api_headers):
-        """Test creating a vendor."""
-        data = {
+        },
+        ["manufacturer_code", "name"],
+    ),
+    (
+        "/api/v1/suppliers/vendors/",
+        {
             "vendor_code": "VND-API-001",
             "name": "API Test Vendor",
             "tier": "preferred",
-        }
-        response = client.post(
-            "/api/v1/suppliers/vendors/", json=data, headers=api_headers
-        )
-        assert response.status_code in [200, 201]
-        result = response.json()
-        assert result["vendor_code"] == "VND-API-001"
-
-
-# =============================================================================
-# Compliance Router Tests
-# =============================================================================
-
-
-class TestComplianceRouter:
-    """Tests for compliance API endpoints."""
-
-    def test_list_regulations(self, client, api_headers):
-        """Test listing regulations."""
-        response = client.get("/api/v1/compliance/regulations", headers=api_headers)
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-
-    def test_create_regulation(self, client, api_headers):
-        """Test creating a regulation."""
-        data = {
+        },
+        ["vendor_code"],
+    ),
+    (
+        "/api/v1/compliance/regulations",
+        {
             "regulation_code": "REG-API-001",
             "name": "API Test Regulation",
             "regulation_type": "ROHS",
             "jurisdiction": "EU",
-        }
-        response = client.post(
-            "/api/v1/compliance/regulations", json=data, headers=api_headers
-        )
-        assert response.status_code in [200, 201]
-        result = response.json()
-        assert result["regulation_code"] == "REG-API-001"
-
-    def test_list_certificates(self, client, api_headers):
-        """Test listing compliance certificates."""
-        response = client.get("/api/v1/compliance/certificates", headers=api_headers)
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-
-
-# =============================================================================
-# Costing Router Tests
-# =============================================================================
+        },
+        ["regulation_code"],
+    ),
+    (
+        "/api/v1/bulletins",
+        {
+            "bulletin_number": "SB-API-001",
+            "bulletin_type": "mandatory",
+            "title": "API Test Bulletin",
+            "summary": "Created via API test",
+        },
+        ["bulletin_number"],
+    ),
+    (
+        "/api/v1/projects/",
+        {
+            "project_number": "PRJ-API-001",
+            "name": "API Test Project",
+            "project_type": "product",
+            "description": "Created via API test",
+        },
+        ["project_number", "name"],
+    ),
+]
 
 
-class TestCostingRouter:
-    """Tests for costing API endpoints."""
+@pytest.mark.anyio
+@pytest.mark.integration
+class TestEndpointSmoke:
+    """List and create smoke tests shared by the CRUD routers."""
 
-    def test_list_variances(self, client, api_headers):
-        """Test listing cost variances."""
-        response = client.get("/api/v1/costing/variances", headers=api_headers)
+    @pytest.mark.parametrize("url", LIST_ENDPOINTS)
+    async def test_list(self, client, api_headers, url):
+        """Test the list endpoint returns a JSON list."""
+        response = await client.get(url, headers=api_headers)
         assert response.status_code == 200
         assert isinstance(response.json(), list)
 
+    @pytest.mark.parametrize(
+        "url,payload,echo_fields", CREATE_CASES, ids=[case[0] for case in CREATE_CASES]
+    )
+    async def test_create(self, client, api_headers, url, payload, echo_fields):
+        """Test the create endpoint persists and echoes the payload."""
+        response = await client.post(url, json=payload, headers=api_headers)
+        assert response.status_code in [200, 201]
+        result = response.json()
+        for field in echo_fields:
+            assert result[field] == payload[field]
+
 
 # =============================================================================
-# Service Bulletins Router Tests
+# Requirements Router Tests
 # =============================================================================
 
 
-class TestServiceBulletinsRouter:
-    """Tests for service bulletins API endpoints."""
-
-    def test_list_bulletins(self, client, api_headers):
-        """Test listing service bulletins."""
-        response = client.get("/api/v1/bulletins", headers=api_headers)
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-
-    def test_create_bulletin(self, client, api_headers):
-        """Test creating a service bulletin."""
-        data = {
-            "bulletin_number": "SB-API-001",
-            "bulletin_type": "mandatory",
-            "title": "API Test Bulletin",
-            "summary": "Created via API test",
-        }
-        response = client.post("/api/v1/bulletins", json=data, headers=api_headers)
-        assert response.status_code in [200, 201]
-        result = response.json()
-        assert result["bulletin_number"] == "SB-API-001"
+@pytest.mark.anyio
+@pytest.mark.integration
+class TestRequirementsRouter:
+    """Tests for requirements API endpoints."""
 
-    def test_list_maintenance_schedules(self, client, api_headers):
-        """Test listing maintenance schedules."""
-        response = client.get(
-            "/api/v1/bulletins/maintenance/schedules", headers=api_headers
-        )
+    async def test_get_requirement(self, client, api_headers, created_requirement):
+        """Test getting a specific requirement."""
+        req_id = created_requirement["id"]
+        response = await client.get(f"/api/v1/requirements/{req_id}", headers=api_headers)
         assert response.status_code == 200
-        assert isinstance(response.json(), list)
+        assert response.json()["requirement_number"] == "REQ-API-002"
 
-    def test_list_units(self, client, api_headers):
-        """Test listing unit configurations."""
-        response = client.get("/api/v1/bulletins/units", headers=api_headers)
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
+    async def test_get_nonexistent_requirement(self, client, api_headers):
+        """Test getting a nonexistent requirement returns 404."""
+        response = await client.get(f"/api/v1/requirements/{next_id()}", headers=api_headers)
+        assert response.status_code == 404
 
 
 # =============================================================================
@@ -253,68 +187,31 @@ class TestServiceBulletinsRouter:
 # =============================================================================
 
 
+@pytest.mark.anyio
+@pytest.mark.integration
 class TestProjectsRouter:
     """Tests for projects API endpoints."""
 
-    def test_list_projects(self, client, api_headers):
-        """Test listing projects."""
-        response = client.get("/api/v1/projects/", headers=api_headers)
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-
-    def test_create_project(self, client, api_headers):
-        """Test creating a project."""
-        data = {
-            "project_number": "PRJ-API-001",
-            "name": "API Test Project",
-            "project_type": "product",
-            "description": "Created via API test",
-        }
-        response = client.post("/api/v1/projects/", json=data, headers=api_headers)
-        assert response.status_code in [200, 201]
-        result = response.json()
-        assert result["project_number"] == "PRJ-API-001"
-        assert result["name"] == "API Test Project"
-        return result["id"]
-
-    def test_get_project(self, client, api_headers):
+    async def test_get_project(self, client, api_headers, created_project):
         """Test getting a specific project."""
-        # First create one
-        data = {
-            "project_number": "PRJ-API-002",
-            "name": "Get Test Project",
-        }
-        create_resp = client.post("/api/v1/projects/", json=data, headers=api_headers)
-        proj_id = create_resp.json()["id"]
-
-        # Now get it
-        response = client.get(f"/api/v1/projects/{proj_id}", headers=api_headers)
+        proj_id = created_project["id"]
+        response = await client.get(f"/api/v1/projects/{proj_id}", headers=api_headers)
         assert response.status_code == 200
         assert response.json()["project_number"] == "PRJ-API-002"
 
-    def test_list_project_milestones(self, client, api_headers):
+    async def test_list_project_milestones(self, client, api_headers, created_project):
         """Test listing milestones for a project."""
-        # First create a project
-        data = {"project_number": "PRJ-MLST-001", "name": "Milestone Test Project"}
-        create_resp = client.post("/api/v1/projects", json=data, headers=api_headers)
-        proj_id = create_resp.json()["id"]
-
-        # List milestones
-        response = client.get(
+        proj_id = created_project["id"]
+        response = await client.get(
             f"/api/v1/projects/{proj_id}/milestones", headers=api_headers
         )
         assert response.status_code == 200
         assert isinstance(response.json(), list)
 
-    def test_list_project_deliverables(self, client, api_headers):
+    async def test_list_project_deliverables(self, client, api_headers, created_project):
         """Test listing deliverables for a project."""
-        # First create a project
-        data = {"project_number": "PRJ-DLVR-001", "name": "Deliverable Test Project"}
-        create_resp = client.post("/api/v1/projects", json=data, headers=api_headers)
-        proj_id = create_resp.json()["id"]
-
-        # List deliverables
-        response = client.get(
+        proj_id = created_project["id"]
+        response = await client.get(
             f"/api/v1/projects/{proj_id}/deliverables", headers=api_headers
         )
         assert response.status_code == 200
@@ -326,16 +223,18 @@ class TestProjectsRouter:
 # =============================================================================
 
 
+@pytest.mark.anyio
+@pytest.mark.integration
 class TestHealthEndpoints:
     """Tests for health check endpoints."""
 
-    def test_health_check(self, client, api_headers):
+    async def test_health_check(self, client, api_headers):
         """Test main health check endpoint."""
-        response = client.get("/health", headers=api_headers)
+        response = await client.get("/health", headers=api_headers)
         assert response.status_code == 200
         assert response.json()["status"] == "healthy"
 
-    def test_root_endpoint(self, client, api_headers):
+    async def test_root_endpoint(self, client, api_headers):
         """Test root API endpoint."""
-        response = client.get("/", headers=api_headers)
+        response = await client.get("/", headers=api_headers)
         assert response.status_code == 200
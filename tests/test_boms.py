@@ -6,20 +6,24 @@ Tests Bill of Materials model and database operations.
 
 import pytest
 from decimal import Decimal
-from uuid import uuid4
+
+from sqlalchemy import insert, select
 
 from plm.boms.models import BOM, BOMItem, BOMType, Effectivity
 from plm.parts.models import PartStatus, UnitOfMeasure
 from plm.db.models import BOMModel, BOMItemModel, PartModel
 
+from tests._ids import next_id
+
 
+@pytest.mark.unit
 class TestBOMModel:
     """Tests for BOM dataclass model."""
 
     def test_create_bom(self):
         """Test creating a BOM."""
         bom = BOM(
-            id=str(uuid4()),
+            id=next_id(),
             bom_number="BOM-TEST-001",
             revision="A",
             name="Test BOM",
@@ -68,13 +72,13 @@ class TestBOMDatabase:
 
     def test_persist_bom(self, session, sample_bom):
         """Test persisting a BOM to database."""
-        found = session.query(BOMModel).filter_by(id=sample_bom.id).first()
+        found = session.scalars(select(BOMModel).filter_by(id=sample_bom.id)).first()
         assert found is not None
         assert found.bom_number == "BOM-WALL-EXT-001"
 
     def test_bom_items(self, session, sample_bom):
         """Test retrieving BOM items."""
-        items = session.query(BOMItemModel).filter_by(bom_id=sample_bom.id).all()
+        items = session.scalars(select(BOMItemModel).filter_by(bom_id=sample_bom.id)).all()
         assert len(items) == 2
 
         # Check quantities
@@ -83,11 +87,20 @@ class TestBOMDatabase:
 
     def test_bom_cost_rollup(self, session, sample_bom):
         """Test calculating total BOM cost."""
-        items = session.query(BOMItemModel).filter_by(bom_id=sample_bom.id).all()
+        items = session.scalars(
+            select(BOMItemModel).where(BOMItemModel.bom_id == sample_bom.id)
+        ).all()
+
+        # One SELECT for every referenced part rather than one per item
+        part_ids = [item.part_id for item in items]
+        parts = {
+            part.id: part
+            for part in session.scalars(select(PartModel).where(PartModel.id.in_(part_ids)))
+        }
 
         total_cost = Decimal("0")
         for item in items:
-            part = session.query(PartModel).filter_by(id=item.part_id).first()
+            part = parts.get(item.part_id)
             if part and part.unit_cost:
                 total_cost += item.quantity * part.unit_cost
 
@@ -97,7 +110,7 @@ class TestBOMDatabase:
     def test_add_bom_item(self, session, sample_bom, multiple_parts):
         """Test adding an item to a BOM."""
         new_item = BOMItemModel(
-            id=str(uuid4()),
+            id=next_id(),
             bom_id=sample_bom.id,
             part_id=multiple_parts[0].id,
             part_number=multiple_parts[0].part_number,
@@ -110,23 +123,23 @@ class TestBOMDatabase:
         session.add(new_item)
         session.commit()
 
-        items = session.query(BOMItemModel).filter_by(bom_id=sample_bom.id).all()
+        items = session.scalars(select(BOMItemModel).filter_by(bom_id=sample_bom.id)).all()
         assert len(items) == 3
 
     def test_remove_bom_item(self, session, sample_bom):
         """Test removing an item from a BOM."""
-        items = session.query(BOMItemModel).filter_by(bom_id=sample_bom.id).all()
+        items = session.scalars(select(BOMItemModel).filter_by(bom_id=sample_bom.id)).all()
         session.delete(items[0])
         session.commit()
 
-        remaining = session.query(BOMItemModel).filter_by(bom_id=sample_bom.id).all()
+        remaining = session.scalars(select(BOMItemModel).filter_by(bom_id=sample_bom.id)).all()
         assert len(remaining) == 1
 
     def test_bom_effectivity(self, session, sample_bom):
         """Test BOM effectivity states."""
         # Create multiple BOM versions with different effectivities
         as_approved = BOMModel(
-            id=str(uuid4()),
+            id=next_id(),
             bom_number=sample_bom.bom_number,
             revision="B",
             name=sample_bom.name,
@@ -141,14 +154,16 @@ class TestBOMDatabase:
 
         # Query by effectivity
         designed = (
-            session.query(BOMModel)
-            .filter_by(effectivity=Effectivity.AS_DESIGNED)
-            .all()
+            session.scalars(
+                select(BOMModel)
+                .filter_by(effectivity=Effectivity.AS_DESIGNED)
+            ).all()
         )
         approved = (
-            session.query(BOMModel)
-            .filter_by(effectivity=Effectivity.AS_APPROVED)
-            .all()
+            session.scalars(
+                select(BOMModel)
+                .filter_by(effectivity=Effectivity.AS_APPROVED)
+            ).all()
         )
 
         assert len(designed) == 1
@@ -160,64 +175,59 @@ class TestBOMHierarchy:
 
     def test_nested_bom(self, session, multiple_parts):
         """Test creating nested BOMs (sub-assemblies)."""
-        # Create sub-assembly BOM
         sub_assy = multiple_parts[2]  # Wall assembly
 
-        sub_bom = BOMModel(
-            id=str(uuid4()),
-            bom_number="BOM-SUB-001",
-            revision="A",
-            name="Sub-Assembly BOM",
-            parent_part_id=sub_assy.id,
-            parent_part_revision="A",
-            bom_type=BOMType.ENGINEERING,
-            status=PartStatus.RELEASED,
-        )
-        session.add(sub_bom)
-        session.flush()
-
-        # Add items to sub-BOM
-        sub_item = BOMItemModel(
-            id=str(uuid4()),
-            bom_id=sub_bom.id,
-            part_id=multiple_parts[0].id,
-            part_number=multiple_parts[0].part_number,
-            part_revision="A",
-            quantity=Decimal("4"),
-            has_sub_bom=False,
-        )
-        session.add(sub_item)
-
-        # Create parent BOM that includes sub-assembly
-        parent_bom = BOMModel(
-            id=str(uuid4()),
-            bom_number="BOM-PARENT-001",
-            revision="A",
-            name="Parent Product BOM",
-            parent_part_id="",
-            parent_part_revision="",
-            bom_type=BOMType.ENGINEERING,
-            status=PartStatus.DRAFT,
-        )
-        session.add(parent_bom)
-        session.flush()
-
-        # Add sub-assembly to parent
-        parent_item = BOMItemModel(
-            id=str(uuid4()),
-            bom_id=parent_bom.id,
-            part_id=sub_assy.id,
-            part_number=sub_assy.part_number,
-            part_revision="A",
-            quantity=Decimal("4"),  # 4 wall sections
-            has_sub_bom=True,  # Indicates this part has its own BOM
-        )
-        session.add(parent_item)
-        session.commit()
+        # Create sub-assembly BOM and a parent BOM that includes it
+        sub_bom_id = next_id()
+        parent_bom_id = next_id()
+        session.execute(insert(BOMModel), [
+            {
+                "id": sub_bom_id,
+                "bom_number": "BOM-SUB-001",
+                "revision": "A",
+                "name": "Sub-Assembly BOM",
+                "parent_part_id": sub_assy.id,
+                "parent_part_revision": "A",
+                "bom_type": BOMType.ENGINEERING,
+                "status": PartStatus.RELEASED,
+            },
+            {
+                "id": parent_bom_id,
+                "bom_number": "BOM-PARENT-001",
+                "revision": "A",
+                "name": "Parent Product BOM",
+                "parent_part_id": "",
+                "parent_part_revision": "",
+                "bom_type": BOMType.ENGINEERING,
+                "status": PartStatus.DRAFT,
+            },
+        ])
+
+        # Add lumber to the sub-BOM and the sub-assembly to the parent
+        session.execute(insert(BOMItemModel), [
+            {
+                "id": next_id(),
+                "bom_id": sub_bom_id,
+                "part_id": multiple_parts[0].id,
+                "part_number": multiple_parts[0].part_number,
+                "part_revision": "A",
+                "quantity": Decimal("4"),
+                "has_sub_bom": False,
+            },
+            {
+                "id": next_id(),
+                "bom_id": parent_bom_id,
+                "part_id": sub_assy.id,
+                "part_number": sub_assy.part_number,
+                "part_revision": "A",
+                "quantity": Decimal("4"),  # 4 wall sections
+                "has_sub_bom": True,  # Indicates this part has its own BOM
+            },
+        ])
 
         # Verify structure
         parent_items = (
-            session.query(BOMItemModel).filter_by(bom_id=parent_bom.id).all()
+            session.scalars(select(BOMItemModel).filter_by(bom_id=parent_bom_id)).all()
         )
         assert len(parent_items) == 1
         assert parent_items[0].has_sub_bom is True
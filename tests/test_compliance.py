@@ -7,7 +7,6 @@ Tests Regulation, ComplianceDeclaration, and related models.
 import pytest
 from datetime import date, datetime
 from decimal import Decimal
-from uuid import uuid4
 
 from plm.compliance.models import (
     Regulation,
@@ -23,47 +22,99 @@ from plm.compliance.models import (
 )
 
 
+pytestmark = pytest.mark.unit
+
+
+# "Today" for every date.today() call in the compliance models
+TODAY = date(2024, 6, 1)
+
+
+class _FixedDate(date):
+    """date whose today() is pinned to TODAY."""
+
+    @classmethod
+    def today(cls):
+        return TODAY
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _freeze_today():
+    """Pin the compliance models' clock so validity checks never age out."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("plm.compliance.models.date", _FixedDate)
+        yield
+
+
+def _regulation(**overrides) -> Regulation:
+    """Build an EU RoHS regulation, overriding only what a test needs."""
+    fields = {
+        "id": "reg-001",
+        "regulation_code": "ROHS-2011/65/EU",
+        "name": "RoHS Directive",
+        "regulation_type": RegulationType.ROHS,
+        "authority": "European Union",
+        "regions": ["EU"],
+    }
+    return Regulation(**{**fields, **overrides})
+
+
+def _certificate(**overrides) -> ComplianceCertificate:
+    """Build an active RoHS certificate, overriding only what a test needs."""
+    fields = {
+        "id": "cert-001",
+        "certificate_number": "CERT-2024-001",
+        "regulation_id": "reg-001",
+        "regulation_code": "ROHS-2011/65/EU",
+        "status": CertificateStatus.ACTIVE,
+    }
+    return ComplianceCertificate(**{**fields, **overrides})
+
+
 class TestRegulationModel:
     """Tests for Regulation dataclass model."""
 
     def test_create_regulation(self):
         """Test creating a regulation."""
-        reg = Regulation(
-            id=str(uuid4()),
-            regulation_code="ROHS-2011/65/EU",
-            name="RoHS Directive",
-            regulation_type=RegulationType.ROHS,
-            authority="European Union",
-            regions=["EU"],
-        )
+        reg = _regulation()
         assert reg.regulation_code == "ROHS-2011/65/EU"
         assert reg.regulation_type == RegulationType.ROHS
         assert reg.is_active is True
 
     def test_regulation_to_dict(self):
         """Test converting regulation to dictionary."""
-        reg = Regulation(
-            id="reg-001",
+        reg = _regulation(
             regulation_code="REACH-1907/2006",
             name="REACH Regulation",
             regulation_type=RegulationType.REACH,
             authority="ECHA",
-            regions=["EU"],
             effective_date=date(2007, 6, 1),
         )
         data = reg.to_dict()
-        assert data["regulation_code"] == "REACH-1907/2006"
-        assert data["regulation_type"] == "reach"
-        assert data["authority"] == "ECHA"
-        assert data["regions"] == ["EU"]
-
-    def test_regulation_type_enums(self):
+        assert data == {
+            "id": "reg-001",
+            "regulation_code": "REACH-1907/2006",
+            "name": "REACH Regulation",
+            "regulation_type": "reach",
+            "authority": "ECHA",
+            "regions": ["EU"],
+            "effective_date": "2007-06-01",
+            "is_active": True,
+        }
+
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (RegulationType.ROHS, "rohs"),
+            (RegulationType.REACH, "reach"),
+            (RegulationType.CONFLICT_MINERALS, "conflict_minerals"),
+            (RegulationType.WEEE, "weee"),
+            (RegulationType.EXPORT_CONTROL, "export_control"),
+        ],
+    )
+    def test_regulation_type_enums(self, member, value):
         """Test regulation type enums."""
-        assert RegulationType.ROHS.value == "rohs"
-        assert RegulationType.REACH.value == "reach"
-        assert RegulationType.CONFLICT_MINERALS.value == "conflict_minerals"
-        assert RegulationType.WEEE.value == "weee"
-        assert RegulationType.EXPORT_CONTROL.value == "export_control"
+        assert member.value == value
+        assert type(member)(value) is member
 
 
 class TestSubstanceDeclaration:
@@ -72,7 +123,7 @@ class TestSubstanceDeclaration:
     def test_create_substance_declaration(self):
         """Test creating a substance declaration."""
         decl = SubstanceDeclaration(
-            id=str(uuid4()),
+            id="sd-001",
             part_id="part-001",
             part_number="PART-12345",
             substance_name="Lead",
@@ -99,18 +150,28 @@ class TestSubstanceDeclaration:
             above_threshold=True,
         )
         data = decl.to_dict()
-        assert data["substance_name"] == "Cadmium"
-        assert data["category"] == "cadmium"
-        assert data["concentration_ppm"] == 150.0
+        expected = {
+            "substance_name": "Cadmium",
+            "category": "cadmium",
+            "concentration_ppm": 150.0,
+        }
+        assert {key: data[key] for key in expected} == expected
         assert data["above_threshold"] is True
 
-    def test_substance_category_enums(self):
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (SubstanceCategory.LEAD, "lead"),
+            (SubstanceCategory.MERCURY, "mercury"),
+            (SubstanceCategory.CADMIUM, "cadmium"),
+            (SubstanceCategory.CHROMIUM_VI, "chromium_vi"),
+            (SubstanceCategory.SVHC, "svhc"),
+        ],
+    )
+    def test_substance_category_enums(self, member, value):
         """Test substance category enums."""
-        assert SubstanceCategory.LEAD.value == "lead"
-        assert SubstanceCategory.MERCURY.value == "mercury"
-        assert SubstanceCategory.CADMIUM.value == "cadmium"
-        assert SubstanceCategory.CHROMIUM_VI.value == "chromium_vi"
-        assert SubstanceCategory.SVHC.value == "svhc"
+        assert member.value == value
+        assert type(member)(value) is member
 
 
 class TestComplianceDeclaration:
@@ -119,7 +180,7 @@ class TestComplianceDeclaration:
     def test_create_compliance_declaration(self):
         """Test creating a compliance declaration."""
         decl = ComplianceDeclaration(
-            id=str(uuid4()),
+            id="cd-001",
             part_id="part-001",
             part_number="PART-12345",
             regulation_id="reg-001",
@@ -132,7 +193,7 @@ class TestComplianceDeclaration:
     def test_compliance_declaration_with_exemption(self):
         """Test compliance declaration with exemption."""
         decl = ComplianceDeclaration(
-            id=str(uuid4()),
+            id="cd-001",
             part_id="part-001",
             part_number="PART-12345",
             regulation_id="reg-001",
@@ -144,13 +205,20 @@ class TestComplianceDeclaration:
         assert decl.status == ComplianceStatus.EXEMPT
         assert decl.exemption_code == "6(c)"
 
-    def test_compliance_status_enums(self):
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (ComplianceStatus.UNKNOWN, "unknown"),
+            (ComplianceStatus.COMPLIANT, "compliant"),
+            (ComplianceStatus.NON_COMPLIANT, "non_compliant"),
+            (ComplianceStatus.EXEMPT, "exempt"),
+            (ComplianceStatus.PENDING_DATA, "pending_data"),
+        ],
+    )
+    def test_compliance_status_enums(self, member, value):
         """Test compliance status enums."""
-        assert ComplianceStatus.UNKNOWN.value == "unknown"
-        assert ComplianceStatus.COMPLIANT.value == "compliant"
-        assert ComplianceStatus.NON_COMPLIANT.value == "non_compliant"
-        assert ComplianceStatus.EXEMPT.value == "exempt"
-        assert ComplianceStatus.PENDING_DATA.value == "pending_data"
+        assert member.value == value
+        assert type(member)(value) is member
 
 
 class TestComplianceCertificate:
@@ -158,14 +226,9 @@ class TestComplianceCertificate:
 
     def test_create_certificate(self):
         """Test creating a compliance certificate."""
-        cert = ComplianceCertificate(
-            id=str(uuid4()),
-            certificate_number="CERT-2024-001",
-            regulation_id="reg-001",
-            regulation_code="ROHS-2011/65/EU",
-            status=CertificateStatus.ACTIVE,
+        cert = _certificate(
             issue_date=date(2024, 1, 1),
-            expiry_date=date(2027, 12, 31),  # Future date
+            expiry_date=date(2025, 12, 31),  # After TODAY
             issued_by="TUV",
         )
         assert cert.certificate_number == "CERT-2024-001"
@@ -174,23 +237,26 @@ class TestComplianceCertificate:
 
     def test_certificate_expired(self):
         """Test expired certificate is_valid property."""
-        cert = ComplianceCertificate(
-            id=str(uuid4()),
+        cert = _certificate(
             certificate_number="CERT-2020-001",
-            regulation_id="reg-001",
-            regulation_code="ROHS",
-            status=CertificateStatus.ACTIVE,
             issue_date=date(2020, 1, 1),
-            expiry_date=date(2021, 12, 31),  # Expired
+            expiry_date=date(2021, 12, 31),  # Before TODAY
         )
         assert cert.is_valid is False
 
-    def test_certificate_status_enums(self):
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (CertificateStatus.DRAFT, "draft"),
+            (CertificateStatus.ACTIVE, "active"),
+            (CertificateStatus.EXPIRED, "expired"),
+            (CertificateStatus.REVOKED, "revoked"),
+        ],
+    )
+    def test_certificate_status_enums(self, member, value):
         """Test certificate status enums."""
-        assert CertificateStatus.DRAFT.value == "draft"
-        assert CertificateStatus.ACTIVE.value == "active"
-        assert CertificateStatus.EXPIRED.value == "expired"
-        assert CertificateStatus.REVOKED.value == "revoked"
+        assert member.value == value
+        assert type(member)(value) is member
 
 
 class TestConflictMineralDeclaration:
@@ -199,7 +265,7 @@ class TestConflictMineralDeclaration:
     def test_create_conflict_mineral_declaration(self):
         """Test creating a 3TG declaration."""
         decl = ConflictMineralDeclaration(
-            id=str(uuid4()),
+            id="cmd-001",
             part_id="part-001",
             part_number="PART-12345",
             contains_tin=True,
@@ -211,18 +277,26 @@ class TestConflictMineralDeclaration:
         assert decl.contains_3tg is True
         assert decl.conflict_free is True
 
-    def test_no_3tg_content(self):
-        """Test declaration with no 3TG content."""
+    @pytest.mark.parametrize(
+        "minerals,expected",
+        [
+            ((), False),
+            (("tin",), True),
+            (("tantalum",), True),
+            (("tungsten",), True),
+            (("gold",), True),
+            (("tin", "tantalum", "tungsten", "gold"), True),
+        ],
+    )
+    def test_contains_3tg(self, minerals, expected):
+        """Test any one of tin, tantalum, tungsten or gold counts as 3TG content."""
         decl = ConflictMineralDeclaration(
-            id=str(uuid4()),
+            id="cmd-001",
             part_id="part-001",
             part_number="PART-12345",
-            contains_tin=False,
-            contains_tantalum=False,
-            contains_tungsten=False,
-            contains_gold=False,
+            **{f"contains_{mineral}": True for mineral in minerals},
         )
-        assert decl.contains_3tg is False
+        assert decl.contains_3tg is expected
 
     def test_conflict_mineral_to_dict(self):
         """Test converting 3TG declaration to dict."""
@@ -235,11 +309,15 @@ class TestConflictMineralDeclaration:
             conflict_free=True,
         )
         data = decl.to_dict()
-        assert data["contains_3tg"] is True
-        assert data["conflict_free"] is True
-        assert data["contains"]["tin"] is True
-        assert data["contains"]["gold"] is True
-        assert data["contains"]["tantalum"] is False
+        assert data == {
+            "id": "cm-001",
+            "part_id": "part-001",
+            "part_number": "PART-12345",
+            "contains_3tg": True,
+            "conflict_free": True,
+            "contains": {"tin": True, "tantalum": False, "tungsten": False, "gold": True},
+            "declaration_date": None,
+        }
 
 
 class TestPartComplianceStatus:
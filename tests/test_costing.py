@@ -7,7 +7,7 @@ Tests CostElement, PartCost, BOMCostRollup, and related models.
 import pytest
 from datetime import date, datetime
 from decimal import Decimal
-from uuid import uuid4
+from functools import cache
 
 from plm.costing.models import (
     CostElement,
@@ -21,13 +21,44 @@ from plm.costing.models import (
 )
 
 
+pytestmark = pytest.mark.unit
+
+
+@cache
+def _element(cost_type: CostType, unit_cost: str, quantity: str = "1") -> CostElement:
+    """Build a CostElement once per distinct (type, unit cost, quantity)."""
+    return CostElement(
+        id=f"e-{cost_type.value}-{unit_cost}x{quantity}",
+        cost_type=cost_type,
+        unit_cost=Decimal(unit_cost),
+        quantity=Decimal(quantity),
+    )
+
+
+def _part_cost(**overrides) -> PartCost:
+    """Build a PartCost for PART-12345, overriding only what a test needs."""
+    fields = {"id": "pc-001", "part_id": "part-001", "part_number": "PART-12345"}
+    return PartCost(**{**fields, **overrides})
+
+
+@pytest.fixture(scope="session")
+def element():
+    """
+    Factory for shared cost elements.
+
+    Elements are cached across tests, so only use them where the code
+    under test reads them; PartCost.calculate_totals does.
+    """
+    return _element
+
+
 class TestCostElementModel:
     """Tests for CostElement dataclass model."""
 
     def test_create_cost_element(self):
         """Test creating a cost element."""
         element = CostElement(
-            id=str(uuid4()),
+            id="ce-001",
             cost_type=CostType.MATERIAL,
             description="Steel plate",
             unit_cost=Decimal("50.00"),
@@ -49,19 +80,29 @@ class TestCostElementModel:
             unit_of_measure="HR",
         )
         data = element.to_dict()
-        assert data["cost_type"] == "labor"
-        assert data["unit_cost"] == 25.00
-        assert data["quantity"] == 4.0
-        assert data["extended_cost"] == 100.00
+        expected = {
+            "cost_type": "labor",
+            "unit_cost": 25.00,
+            "quantity": 4.0,
+            "extended_cost": 100.00,
+        }
+        assert {key: data[key] for key in expected} == expected
 
-    def test_cost_type_enums(self):
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (CostType.MATERIAL, "material"),
+            (CostType.LABOR, "labor"),
+            (CostType.OVERHEAD, "overhead"),
+            (CostType.TOOLING, "tooling"),
+            (CostType.PURCHASED, "purchased"),
+            (CostType.SUBCONTRACT, "subcontract"),
+        ],
+    )
+    def test_cost_type_enums(self, member, value):
         """Test cost type enums."""
-        assert CostType.MATERIAL.value == "material"
-        assert CostType.LABOR.value == "labor"
-        assert CostType.OVERHEAD.value == "overhead"
-        assert CostType.TOOLING.value == "tooling"
-        assert CostType.PURCHASED.value == "purchased"
-        assert CostType.SUBCONTRACT.value == "subcontract"
+        assert member.value == value
+        assert type(member)(value) is member
 
 
 class TestPartCostModel:
@@ -69,10 +110,7 @@ class TestPartCostModel:
 
     def test_create_part_cost(self):
         """Test creating a part cost."""
-        cost = PartCost(
-            id=str(uuid4()),
-            part_id="part-001",
-            part_number="PART-12345",
+        cost = _part_cost(
             status=CostEstimateStatus.DETAILED,
             material_cost=Decimal("100.00"),
             labor_cost=Decimal("50.00"),
@@ -82,31 +120,13 @@ class TestPartCostModel:
         assert cost.total_cost == Decimal("175.00")
         assert cost.status == CostEstimateStatus.DETAILED
 
-    def test_part_cost_calculate_totals(self):
+    def test_part_cost_calculate_totals(self, element):
         """Test calculating totals from elements."""
-        cost = PartCost(
-            id=str(uuid4()),
-            part_id="part-001",
-            part_number="PART-12345",
+        cost = _part_cost(
             elements=[
-                CostElement(
-                    id="e1",
-                    cost_type=CostType.MATERIAL,
-                    unit_cost=Decimal("100"),
-                    quantity=Decimal("1"),
-                ),
-                CostElement(
-                    id="e2",
-                    cost_type=CostType.LABOR,
-                    unit_cost=Decimal("25"),
-                    quantity=Decimal("2"),
-                ),
-                CostElement(
-                    id="e3",
-                    cost_type=CostType.OVERHEAD,
-                    unit_cost=Decimal("15"),
-                    quantity=Decimal("1"),
-                ),
+                element(CostType.MATERIAL, "100"),
+                element(CostType.LABOR, "25", "2"),
+                element(CostType.OVERHEAD, "15"),
             ],
         )
         cost.calculate_totals()
@@ -115,39 +135,33 @@ class TestPartCostModel:
         assert cost.overhead_cost == Decimal("15")
         assert cost.total_cost == Decimal("165")
 
-    def test_part_cost_margin_calculation(self):
+    def test_part_cost_margin_calculation(self, element):
         """Test margin percentage calculation."""
-        cost = PartCost(
-            id=str(uuid4()),
-            part_id="part-001",
-            part_number="PART-12345",
+        cost = _part_cost(
             total_cost=Decimal("80.00"),
             selling_price=Decimal("100.00"),
-            elements=[
-                CostElement(
-                    id="e1",
-                    cost_type=CostType.MATERIAL,
-                    unit_cost=Decimal("80"),
-                    quantity=Decimal("1"),
-                ),
-            ],
+            elements=[element(CostType.MATERIAL, "80")],
         )
         cost.calculate_totals()
         assert cost.margin_percent == 20.0  # (100 - 80) / 100 * 100
 
-    def test_cost_estimate_status_enums(self):
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (CostEstimateStatus.DRAFT, "draft"),
+            (CostEstimateStatus.PRELIMINARY, "preliminary"),
+            (CostEstimateStatus.DETAILED, "detailed"),
+            (CostEstimateStatus.APPROVED, "approved"),
+        ],
+    )
+    def test_cost_estimate_status_enums(self, member, value):
         """Test cost estimate status enums."""
-        assert CostEstimateStatus.DRAFT.value == "draft"
-        assert CostEstimateStatus.PRELIMINARY.value == "preliminary"
-        assert CostEstimateStatus.DETAILED.value == "detailed"
-        assert CostEstimateStatus.APPROVED.value == "approved"
+        assert member.value == value
+        assert type(member)(value) is member
 
     def test_part_cost_to_dict(self):
         """Test converting part cost to dictionary."""
-        cost = PartCost(
-            id="pc-001",
-            part_id="part-001",
-            part_number="PART-12345",
+        cost = _part_cost(
             status=CostEstimateStatus.APPROVED,
             material_cost=Decimal("100.00"),
             labor_cost=Decimal("50.00"),
@@ -157,11 +171,14 @@ class TestPartCostModel:
             lot_size=100,
         )
         data = cost.to_dict()
-        assert data["part_number"] == "PART-12345"
-        assert data["status"] == "approved"
-        assert data["total_cost"] == 175.00
-        assert data["target_cost"] == 180.00
-        assert data["lot_size"] == 100
+        expected = {
+            "part_number": "PART-12345",
+            "status": "approved",
+            "total_cost": 175.00,
+            "target_cost": 180.00,
+            "lot_size": 100,
+        }
+        assert {key: data[key] for key in expected} == expected
 
 
 class TestBOMCostRollup:
@@ -196,9 +213,12 @@ class TestBOMCostRollup:
             parts_without_cost=["PART-99999"],
         )
         data = rollup.to_dict()
-        assert data["bom_number"] == "BOM-12345"
-        assert data["total_cost"] == 800.00
-        assert data["coverage_percent"] == 95.0
+        expected = {
+            "bom_number": "BOM-12345",
+            "total_cost": 800.00,
+            "coverage_percent": 95.0,
+        }
+        assert {key: data[key] for key in expected} == expected
         assert len(data["parts_without_cost"]) == 1
 
 
@@ -208,7 +228,7 @@ class TestCostVariance:
     def test_create_cost_variance(self):
         """Test creating a cost variance."""
         variance = CostVariance(
-            id=str(uuid4()),
+            id="cv-001",
             part_id="part-001",
             part_number="PART-12345",
             period="2024-Q1",
@@ -224,7 +244,7 @@ class TestCostVariance:
     def test_unfavorable_variance(self):
         """Test unfavorable cost variance."""
         variance = CostVariance(
-            id=str(uuid4()),
+            id="cv-001",
             part_id="part-001",
             part_number="PART-12345",
             period="2024-Q1",
@@ -235,13 +255,20 @@ class TestCostVariance:
         assert variance.favorable is False
         assert variance.variance_percent == 10.0
 
-    def test_cost_variance_type_enums(self):
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (CostVarianceType.MATERIAL_PRICE, "material_price"),
+            (CostVarianceType.MATERIAL_USAGE, "material_usage"),
+            (CostVarianceType.LABOR_RATE, "labor_rate"),
+            (CostVarianceType.LABOR_EFFICIENCY, "labor_efficiency"),
+            (CostVarianceType.DESIGN_CHANGE, "design_change"),
+        ],
+    )
+    def test_cost_variance_type_enums(self, member, value):
         """Test cost variance type enums."""
-        assert CostVarianceType.MATERIAL_PRICE.value == "material_price"
-        assert CostVarianceType.MATERIAL_USAGE.value == "material_usage"
-        assert CostVarianceType.LABOR_RATE.value == "labor_rate"
-        assert CostVarianceType.LABOR_EFFICIENCY.value == "labor_efficiency"
-        assert CostVarianceType.DESIGN_CHANGE.value == "design_change"
+        assert member.value == value
+        assert type(member)(value) is member
 
     def test_cost_variance_to_dict(self):
         """Test converting cost variance to dictionary."""
@@ -255,10 +282,13 @@ class TestCostVariance:
             variance_type=CostVarianceType.MATERIAL_PRICE,
         )
         data = variance.to_dict()
-        assert data["period"] == "2024-Q1"
-        assert data["standard_cost"] == 100.00
-        assert data["actual_cost"] == 95.00
-        assert data["variance"] == -5.00
+        expected = {
+            "period": "2024-Q1",
+            "standard_cost": 100.00,
+            "actual_cost": 95.00,
+            "variance": -5.00,
+        }
+        assert {key: data[key] for key in expected} == expected
         assert data["favorable"] is True
 
 
@@ -268,7 +298,7 @@ class TestShouldCostAnalysis:
     def test_create_should_cost_analysis(self):
         """Test creating a should-cost analysis."""
         analysis = ShouldCostAnalysis(
-            id=str(uuid4()),
+            id="sca-001",
             part_id="part-001",
             part_number="PART-12345",
             should_cost=Decimal("80.00"),
@@ -293,8 +323,11 @@ class TestShouldCostAnalysis:
             methodology="parametric",
         )
         data = analysis.to_dict()
-        assert data["should_cost"] == 75.00
-        assert data["current_price"] == 100.00
-        assert data["savings_opportunity"] == 25.00
-        assert data["savings_percent"] == 25.0
-        assert data["methodology"] == "parametric"
+        expected = {
+            "should_cost": 75.00,
+            "current_price": 100.00,
+            "savings_opportunity": 25.00,
+            "savings_percent": 25.0,
+            "methodology": "parametric",
+        }
+        assert {key: data[key] for key in expected} == expected
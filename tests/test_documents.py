@@ -4,15 +4,14 @@ Document Management Tests
 Tests for document CRUD, check-in/check-out, versioning, and file operations.
 """
 
+import orjson
 import pytest
-from uuid import uuid4
+from dataclasses import replace
 from datetime import datetime
 
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, StaticPool
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import insert
 
-from plm.db.base import Base
+from plm.db.models import DocumentModel, PartModel
 from plm.documents.models import (
     DocumentType,
     DocumentStatus,
@@ -22,45 +21,160 @@ from plm.documents.models import (
     DocumentLink,
     increment_document_revision,
 )
+from plm.parts.models import PartStatus, PartType
 
+from tests._db import api_connection
+from tests._ids import next_id
 
-# Test database setup
-test_engine = create_engine(
-    "sqlite:///:memory:",
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
+
+# Static request bodies, encoded once at import and sent with json_headers
+CREATE_BODY = orjson.dumps(
+    {
+        "document_number": "DWG-API-001",
+        "title": "API Test Drawing",
+        "description": "Created via API test",
+        "document_type": "drawing",
+        "category": "Structural",
+    }
 )
-TestSessionLocal = sessionmaker(bind=test_engine, autocommit=False, autoflush=False)
+UPDATE_BODY = orjson.dumps({"title": "Updated Title", "description": "New description"})
+CHECKOUT_BODY = orjson.dumps({"user_id": "engineer-001", "notes": "Making changes"})
+CHECKIN_BODY = orjson.dumps({"user_id": "engineer-001", "change_summary": "Updated layout"})
+ENGINEER_1_BODY = orjson.dumps({"user_id": "engineer-001"})
+ENGINEER_2_BODY = orjson.dumps({"user_id": "engineer-002"})
+SEARCH_BODY = orjson.dumps({"query": "foundation structural", "limit": 10})
+
+
+@pytest.fixture
+def make_draft_doc(client, json_headers, api_db):
+    """Return a coroutine creating a draft document via the API; returns its body."""
+
+    async def _make(**fields) -> dict:
+        data = {"document_number": next_id("DWG"), "title": "Test Document", **fields}
+        response = await client.post(
+            "/api/v1/documents?created_by=test-user",
+            content=orjson.dumps(data),
+            headers=json_headers
+        )
+        assert response.status_code == 201
+        return response.json()
 
-# Create all tables
-Base.metadata.create_all(bind=test_engine)
+    return _make
 
 
-def override_get_db():
-    """Override database dependency for tests."""
-    db = TestSessionLocal()
+@pytest.fixture
+async def checked_out_doc(client, json_headers, make_draft_doc) -> str:
+    """ID of a draft document checked out by engineer-001."""
+    doc = await make_draft_doc(title="Checkout Test")
+    response = await client.post(
+        f"/api/v1/documents/{doc['id']}/checkout",
+        content=ENGINEER_1_BODY,
+        headers=json_headers
+    )
+    assert response.status_code == 200
+    return doc["id"]
+
+
+@pytest.fixture(scope="class")
+async def approved_doc(client, connection, _api_db_override, api_headers, json_headers) -> str:
+    """
+    ID of a document created, submitted and approved once for the class.
+
+    Built through the API in a class-wide savepoint, so each test's own
+    savepoint rolls back whatever it does to the document.
+    """
+    savepoint = connection.begin_nested()
+    token = api_connection.set(connection)
     try:
-        yield db
+        response = await client.post(
+            "/api/v1/documents?created_by=test-user",
+            content=orjson.dumps({"document_number": "DWG-WKF-003", "title": "Revision Test"}),
+            headers=json_headers
+        )
+        assert response.status_code == 201
+        doc_id = response.json()["id"]
+        steps = ("submit-for-review?submitted_by=engineer-001", "approve?approved_by=manager-001")
+        for step in steps:
+            response = await client.post(f"/api/v1/documents/{doc_id}/{step}", headers=api_headers)
+            assert response.status_code == 200
     finally:
-        db.close()
+        api_connection.reset(token)
+    yield doc_id
+    savepoint.rollback()
+
+
+@pytest.fixture(scope="class")
+def linkable_part(connection) -> str:
+    """
+    ID of a part inserted once for the class's link tests.
+
+    Lives in a class-wide savepoint under each test's own, and is rolled
+    back when the class finishes.
+    """
+    savepoint = connection.begin_nested()
+    part_id = next_id("part")
+    connection.execute(
+        insert(PartModel),
+        [
+            {
+                "id": part_id,
+                "part_number": "PART-LNK-001",
+                "revision": "A",
+                "name": "Link Test Part",
+                "part_type": PartType.COMPONENT,
+                "status": PartStatus.DRAFT,
+            }
+        ],
+    )
+    yield part_id
+    savepoint.rollback()
+
+
+@pytest.fixture(scope="class")
+def seeded_docs(connection) -> dict[str, str]:
+    """
+    IDs of draft documents inserted in one batch for the class's tests.
+
+    Keyed by document number. Lives in a class-wide savepoint like
+    linkable_part, so per-test updates and deletes still roll back.
+    """
+    savepoint = connection.begin_nested()
+    rows = [
+        {
+            "id": next_id("doc"),
+            "document_number": document_number,
+            "revision": "A",
+            "title": title,
+            "document_type": DocumentType.OTHER,
+            "status": DocumentStatus.DRAFT,
+            "checkout_status": CheckoutStatus.AVAILABLE,
+            "created_by": "test-user",
+        }
+        for document_number, title in [
+            ("DWG-API-002", "Get Test Document"),
+            ("DWG-API-003", "Original Title"),
+            ("DWG-API-004", "To Delete"),
+        ]
+    ]
+    connection.execute(insert(DocumentModel), rows)
+    yield {row["document_number"]: row["id"] for row in rows}
+    savepoint.rollback()
 
 
 @pytest.fixture(scope="module")
-def client():
-    """Create test client with dependency override."""
-    from plm.api.app import app
-    from plm.api.deps import get_db_session
-
-    app.dependency_overrides[get_db_session] = override_get_db
-    with TestClient(app) as c:
-        yield c
-    app.dependency_overrides.clear()
+def base_document() -> Document:
+    """
+    Draft, available drawing shared by the model tests.
 
-
-@pytest.fixture
-def api_headers():
-    """API headers with auth key."""
-    return {"X-API-Key": "dev-key"}
+    Treat as read-only; derive variants with dataclasses.replace().
+    """
+    return Document(
+        id="doc-001",
+        document_number="DWG-2024-001",
+        revision="A",
+        title="Test Drawing",
+        document_type=DocumentType.DRAWING,
+    )
 
 
 # =============================================================================
@@ -68,49 +182,34 @@ def api_headers():
 # =============================================================================
 
 
+@pytest.mark.unit
 class TestDocumentModels:
     """Tests for document domain models."""
 
-    def test_document_creation(self):
+    def test_document_creation(self, base_document):
         """Test creating a document."""
-        doc = Document(
-            id=str(uuid4()),
-            document_number="DWG-2024-001",
-            revision="A",
-            title="Test Drawing",
-            document_type=DocumentType.DRAWING,
-        )
+        doc = base_document
         assert doc.document_number == "DWG-2024-001"
         assert doc.revision == "A"
         assert doc.full_document_number == "DWG-2024-001-A"
         assert doc.status == DocumentStatus.DRAFT
         assert doc.checkout_status == CheckoutStatus.AVAILABLE
 
-    def test_document_can_checkout(self):
+    def test_document_can_checkout(self, base_document):
         """Test checkout eligibility."""
-        doc = Document(
-            id=str(uuid4()),
-            document_number="DWG-2024-002",
-            revision="A",
-            title="Checkout Test",
-        )
-        assert doc.can_checkout() is True
+        assert base_document.can_checkout() is True
 
-        doc.checkout_status = CheckoutStatus.CHECKED_OUT
+        doc = replace(base_document, checkout_status=CheckoutStatus.CHECKED_OUT)
         assert doc.can_checkout() is False
 
-        doc.checkout_status = CheckoutStatus.AVAILABLE
-        doc.status = DocumentStatus.OBSOLETE
+        doc = replace(base_document, status=DocumentStatus.OBSOLETE)
         assert doc.can_checkout() is False
 
-    def test_document_can_checkin(self):
+    def test_document_can_checkin(self, base_document):
         """Test checkin eligibility."""
         user_id = "user-001"
-        doc = Document(
-            id=str(uuid4()),
-            document_number="DWG-2024-003",
-            revision="A",
-            title="Checkin Test",
+        doc = replace(
+            base_document,
             checkout_status=CheckoutStatus.CHECKED_OUT,
             checked_out_by=user_id,
         )
@@ -120,8 +219,8 @@ class TestDocumentModels:
     def test_document_version_creation(self):
         """Test creating a document version."""
         version = DocumentVersion(
-            id=str(uuid4()),
-            document_id=str(uuid4()),
+            id="dv-001",
+            document_id="doc-001",
             version_number=1,
             revision="A",
             storage_path="/docs/test.pdf",
@@ -134,24 +233,27 @@ class TestDocumentModels:
     def test_document_link_creation(self):
         """Test creating a document link."""
         link = DocumentLink(
-            id=str(uuid4()),
-            document_id=str(uuid4()),
-            part_id=str(uuid4()),
+            id="dl-001",
+            document_id="doc-001",
+            part_id="part-001",
             link_type="primary",
         )
         assert link.link_type == "primary"
 
-    def test_increment_revision_alpha(self):
-        """Test incrementing alpha revisions."""
-        assert increment_document_revision("A") == "B"
-        assert increment_document_revision("B") == "C"
-        assert increment_document_revision("Z") == "AA"
-
-    def test_increment_revision_numeric(self):
-        """Test incrementing numeric revisions."""
-        assert increment_document_revision("1.0") == "1.1"
-        assert increment_document_revision("1.9") == "1.10"
-        assert increment_document_revision("2.5") == "2.6"
+    @pytest.mark.parametrize(
+        "revision,expected",
+        [
+            ("A", "B"),
+            ("B", "C"),
+            ("Z", "AA"),
+            ("1.0", "1.1"),
+            ("1.9", "1.10"),
+            ("2.5", "2.6"),
+        ],
+    )
+    def test_increment_revision(self, revision, expected):
+        """Test incrementing alpha and numeric revisions."""
+        assert increment_document_revision(revision) == expected
 
 
 # =============================================================================
@@ -159,28 +261,25 @@ class TestDocumentModels:
 # =============================================================================
 
 
+@pytest.mark.anyio
+@pytest.mark.integration
+@pytest.mark.usefixtures("api_db")
 class TestDocumentsRouter:
     """Tests for documents API endpoints."""
 
-    def test_list_documents(self, client, api_headers):
+    async def test_list_documents(self, client, api_headers, seeded_docs):
         """Test listing documents."""
-        response = client.get("/api/v1/documents", headers=api_headers)
+        response = await client.get("/api/v1/documents", headers=api_headers)
         assert response.status_code == 200
-        assert isinstance(response.json(), list)
+        listed = {doc["id"] for doc in response.json()}
+        assert set(seeded_docs.values()) <= listed
 
-    def test_create_document(self, client, api_headers):
+    async def test_create_document(self, client, json_headers):
         """Test creating a document."""
-        data = {
-            "document_number": "DWG-API-001",
-            "title": "API Test Drawing",
-            "description": "Created via API test",
-            "document_type": "drawing",
-            "category": "Structural",
-        }
-        response = client.post(
+        response = await client.post(
             "/api/v1/documents?created_by=test-user",
-            json=data,
-            headers=api_headers
+            content=CREATE_BODY,
+            headers=json_headers
         )
         assert response.status_code == 201
         result = response.json()
@@ -190,169 +289,92 @@ class TestDocumentsRouter:
         assert result["revision"] == "A"
         return result["id"]
 
-    def test_get_document(self, client, api_headers):
+    async def test_get_document(self, client, api_headers, seeded_docs):
         """Test getting a document."""
-        # First create one
-        data = {
-            "document_number": "DWG-API-002",
-            "title": "Get Test Document",
-        }
-        create_resp = client.post(
-            "/api/v1/documents?created_by=test-user",
-            json=data,
-            headers=api_headers
-        )
-        doc_id = create_resp.json()["id"]
-
-        # Now get it
-        response = client.get(f"/api/v1/documents/{doc_id}", headers=api_headers)
+        doc_id = seeded_docs["DWG-API-002"]
+        response = await client.get(f"/api/v1/documents/{doc_id}", headers=api_headers)
         assert response.status_code == 200
         assert response.json()["document_number"] == "DWG-API-002"
 
-    def test_get_nonexistent_document(self, client, api_headers):
+    async def test_get_nonexistent_document(self, client, api_headers):
         """Test getting a nonexistent document returns 404."""
-        response = client.get(f"/api/v1/documents/{uuid4()}", headers=api_headers)
+        response = await client.get(f"/api/v1/documents/{next_id()}", headers=api_headers)
         assert response.status_code == 404
 
-    def test_update_document(self, client, api_headers):
+    async def test_update_document(self, client, json_headers, seeded_docs):
         """Test updating a document."""
-        # Create
-        data = {"document_number": "DWG-API-003", "title": "Original Title"}
-        create_resp = client.post(
-            "/api/v1/documents?created_by=test-user",
-            json=data,
-            headers=api_headers
-        )
-        doc_id = create_resp.json()["id"]
-
-        # Update
-        update_data = {"title": "Updated Title", "description": "New description"}
-        response = client.patch(
+        doc_id = seeded_docs["DWG-API-003"]
+        response = await client.patch(
             f"/api/v1/documents/{doc_id}",
-            json=update_data,
-            headers=api_headers
+            content=UPDATE_BODY,
+            headers=json_headers
         )
         assert response.status_code == 200
         assert response.json()["title"] == "Updated Title"
 
-    def test_delete_draft_document(self, client, api_headers):
+    async def test_delete_draft_document(self, client, api_headers, seeded_docs):
         """Test deleting a draft document."""
-        # Create
-        data = {"document_number": "DWG-API-004", "title": "To Delete"}
-        create_resp = client.post(
-            "/api/v1/documents?created_by=test-user",
-            json=data,
-            headers=api_headers
-        )
-        doc_id = create_resp.json()["id"]
-
-        # Delete
-        response = client.delete(f"/api/v1/documents/{doc_id}", headers=api_headers)
+        doc_id = seeded_docs["DWG-API-004"]
+        response = await client.delete(f"/api/v1/documents/{doc_id}", headers=api_headers)
         assert response.status_code == 204
 
 
+@pytest.mark.anyio
+@pytest.mark.integration
+@pytest.mark.usefixtures("api_db")
 class TestCheckInCheckOut:
     """Tests for check-in/check-out workflow."""
 
-    def test_checkout_document(self, client, api_headers):
+    async def test_checkout_document(self, client, json_headers, make_draft_doc):
         """Test checking out a document."""
         # Create
-        data = {"document_number": "DWG-CHK-001", "title": "Checkout Test"}
-        create_resp = client.post(
-            "/api/v1/documents?created_by=test-user",
-            json=data,
-            headers=api_headers
-        )
-        doc_id = create_resp.json()["id"]
+        doc = await make_draft_doc(title="Checkout Test")
+        doc_id = doc["id"]
 
         # Checkout
-        checkout_data = {"user_id": "engineer-001", "notes": "Making changes"}
-        response = client.post(
+        response = await client.post(
             f"/api/v1/documents/{doc_id}/checkout",
-            json=checkout_data,
-            headers=api_headers
+            content=CHECKOUT_BODY,
+            headers=json_headers
         )
         assert response.status_code == 200
         result = response.json()
         assert result["checkout_status"] == "checked_out"
         assert result["checked_out_by"] == "engineer-001"
 
-    def test_checkin_document(self, client, api_headers):
+    async def test_checkin_document(self, client, json_headers, checked_out_doc):
         """Test checking in a document."""
-        # Create and checkout
-        data = {"document_number": "DWG-CHK-002", "title": "Checkin Test"}
-        create_resp = client.post(
-            "/api/v1/documents?created_by=test-user",
-            json=data,
-            headers=api_headers
-        )
-        doc_id = create_resp.json()["id"]
-
-        checkout_data = {"user_id": "engineer-001"}
-        client.post(
-            f"/api/v1/documents/{doc_id}/checkout",
-            json=checkout_data,
-            headers=api_headers
-        )
+        doc_id = checked_out_doc
 
         # Checkin
-        checkin_data = {"user_id": "engineer-001", "change_summary": "Updated layout"}
-        response = client.post(
+        response = await client.post(
             f"/api/v1/documents/{doc_id}/checkin",
-            json=checkin_data,
-            headers=api_headers
+            content=CHECKIN_BODY,
+            headers=json_headers
         )
         assert response.status_code == 200
         result = response.json()
         assert result["checkout_status"] == "available"
         assert result["checked_out_by"] is None
 
-    def test_cannot_checkout_already_checked_out(self, client, api_headers):
+    async def test_cannot_checkout_already_checked_out(self, client, json_headers, checked_out_doc):
         """Test cannot checkout an already checked out document."""
-        # Create and checkout
-        data = {"document_number": "DWG-CHK-003", "title": "Double Checkout Test"}
-        create_resp = client.post(
-            "/api/v1/documents?created_by=test-user",
-            json=data,
-            headers=api_headers
-        )
-        doc_id = create_resp.json()["id"]
-
-        checkout_data = {"user_id": "engineer-001"}
-        client.post(
-            f"/api/v1/documents/{doc_id}/checkout",
-            json=checkout_data,
-            headers=api_headers
-        )
+        doc_id = checked_out_doc
 
         # Try to checkout again
-        response = client.post(
+        response = await client.post(
             f"/api/v1/documents/{doc_id}/checkout",
-            json={"user_id": "engineer-002"},
-            headers=api_headers
+            content=ENGINEER_2_BODY,
+            headers=json_headers
         )
         assert response.status_code == 400
 
-    def test_cancel_checkout(self, client, api_headers):
+    async def test_cancel_checkout(self, client, api_headers, checked_out_doc):
         """Test canceling a checkout."""
-        # Create and checkout
-        data = {"document_number": "DWG-CHK-004", "title": "Cancel Test"}
-        create_resp = client.post(
-            "/api/v1/documents?created_by=test-user",
-            json=data,
-            headers=api_headers
-        )
-        doc_id = create_resp.json()["id"]
-
-        checkout_data = {"user_id": "engineer-001"}
-        client.post(
-            f"/api/v1/documents/{doc_id}/checkout",
-            json=checkout_data,
-            headers=api_headers
-        )
+        doc_id = checked_out_doc
 
         # Cancel
-        response = client.post(
+        response = await client.post(
             f"/api/v1/documents/{doc_id}/cancel-checkout?user_id=engineer-001",
             headers=api_headers
         )
@@ -361,46 +383,39 @@ class TestCheckInCheckOut:
         assert result["checkout_status"] == "available"
 
 
+@pytest.mark.anyio
+@pytest.mark.integration
+@pytest.mark.usefixtures("api_db")
 class TestDocumentWorkflow:
     """Tests for document approval workflow."""
 
-    def test_submit_for_review(self, client, api_headers):
+    async def test_submit_for_review(self, client, api_headers, make_draft_doc):
         """Test submitting a document for review."""
         # Create
-        data = {"document_number": "DWG-WKF-001", "title": "Workflow Test"}
-        create_resp = client.post(
-            "/api/v1/documents?created_by=test-user",
-            json=data,
-            headers=api_headers
-        )
-        doc_id = create_resp.json()["id"]
+        doc = await make_draft_doc(title="Workflow Test")
+        doc_id = doc["id"]
 
         # Submit
-        response = client.post(
+        response = await client.post(
             f"/api/v1/documents/{doc_id}/submit-for-review?submitted_by=engineer-001",
             headers=api_headers
         )
         assert response.status_code == 200
         assert response.json()["status"] == "pending_review"
 
-    def test_approve_document(self, client, api_headers):
+    async def test_approve_document(self, client, api_headers, make_draft_doc):
         """Test approving a document."""
         # Create and submit
-        data = {"document_number": "DWG-WKF-002", "title": "Approval Test"}
-        create_resp = client.post(
-            "/api/v1/documents?created_by=test-user",
-            json=data,
-            headers=api_headers
-        )
-        doc_id = create_resp.json()["id"]
+        doc = await make_draft_doc(title="Approval Test")
+        doc_id = doc["id"]
 
-        client.post(
+        await client.post(
             f"/api/v1/documents/{doc_id}/submit-for-review?submitted_by=engineer-001",
             headers=api_headers
         )
 
         # Approve
-        response = client.post(
+        response = await client.post(
             f"/api/v1/documents/{doc_id}/approve?approved_by=manager-001",
             headers=api_headers
         )
@@ -409,28 +424,12 @@ class TestDocumentWorkflow:
         assert result["status"] == "approved"
         assert result["released_by"] == "manager-001"
 
-    def test_revise_approved_document(self, client, api_headers):
+    async def test_revise_approved_document(self, client, api_headers, approved_doc):
         """Test creating a new revision of an approved document."""
-        # Create, submit, and approve
-        data = {"document_number": "DWG-WKF-003", "title": "Revision Test"}
-        create_resp = client.post(
-            "/api/v1/documents?created_by=test-user",
-            json=data,
-            headers=api_headers
-        )
-        doc_id = create_resp.json()["id"]
-
-        client.post(
-            f"/api/v1/documents/{doc_id}/submit-for-review?submitted_by=engineer-001",
-            headers=api_headers
-        )
-        client.post(
-            f"/api/v1/documents/{doc_id}/approve?approved_by=manager-001",
-            headers=api_headers
-        )
+        doc_id = approved_doc
 
         # Revise
-        response = client.post(
+        response = await client.post(
             f"/api/v1/documents/{doc_id}/revise?revised_by=engineer-001",
             headers=api_headers
         )
@@ -441,131 +440,88 @@ class TestDocumentWorkflow:
         assert result["document_number"] == "DWG-WKF-003"
 
 
+@pytest.mark.anyio
+@pytest.mark.integration
+@pytest.mark.usefixtures("api_db")
 class TestDocumentLinks:
     """Tests for document linking."""
 
-    def test_link_document_to_part(self, client, api_headers):
+    async def test_link_document_to_part(self, client, json_headers, make_draft_doc, linkable_part):
         """Test linking a document to a part."""
-        # Create a document
-        doc_data = {"document_number": "DWG-LNK-001", "title": "Link Test"}
-        doc_resp = client.post(
-            "/api/v1/documents?created_by=test-user",
-            json=doc_data,
-            headers=api_headers
-        )
-        doc_id = doc_resp.json()["id"]
-
-        # Create a part first
-        from uuid import uuid4
-        from sqlalchemy.orm import sessionmaker
-        from plm.db.models import PartModel
-
-        db = TestSessionLocal()
-        part = PartModel(
-            id=str(uuid4()),
-            part_number="PART-LNK-001",
-            revision="A",
-            name="Link Test Part",
-            part_type="component",
-            status="draft",
-        )
-        db.add(part)
-        db.commit()
-        part_id = part.id
-        db.close()
+        doc = await make_draft_doc(title="Link Test")
+        doc_id = doc["id"]
+        part_id = linkable_part
 
         # Link document to part
         link_data = {"part_id": part_id, "link_type": "primary"}
-        response = client.post(
+        response = await client.post(
             f"/api/v1/documents/{doc_id}/links?created_by=engineer-001",
-            json=link_data,
-            headers=api_headers
+            content=orjson.dumps(link_data),
+            headers=json_headers
         )
         assert response.status_code == 201
         result = response.json()
         assert result["part_id"] == part_id
         assert result["link_type"] == "primary"
 
-    def test_list_document_links(self, client, api_headers):
+    async def test_list_document_links(self, client, api_headers, make_draft_doc):
         """Test listing document links."""
         # Create a document with links
-        doc_data = {"document_number": "DWG-LNK-002", "title": "List Links Test"}
-        doc_resp = client.post(
-            "/api/v1/documents?created_by=test-user",
-            json=doc_data,
-            headers=api_headers
-        )
-        doc_id = doc_resp.json()["id"]
+        doc = await make_draft_doc(title="List Links Test")
+        doc_id = doc["id"]
 
         # List links (empty initially)
-        response = client.get(f"/api/v1/documents/{doc_id}/links", headers=api_headers)
+        response = await client.get(f"/api/v1/documents/{doc_id}/links", headers=api_headers)
         assert response.status_code == 200
         assert isinstance(response.json(), list)
 
 
+@pytest.mark.anyio
+@pytest.mark.integration
+@pytest.mark.usefixtures("api_db")
 class TestDocumentVersions:
     """Tests for document versioning."""
 
-    def test_list_document_versions(self, client, api_headers):
+    async def test_list_document_versions(self, client, api_headers, make_draft_doc):
         """Test listing document versions."""
         # Create a document
-        doc_data = {"document_number": "DWG-VER-001", "title": "Version Test"}
-        doc_resp = client.post(
-            "/api/v1/documents?created_by=test-user",
-            json=doc_data,
-            headers=api_headers
-        )
-        doc_id = doc_resp.json()["id"]
+        doc = await make_draft_doc(title="Version Test")
+        doc_id = doc["id"]
 
         # List versions (empty initially)
-        response = client.get(f"/api/v1/documents/{doc_id}/versions", headers=api_headers)
+        response = await client.get(f"/api/v1/documents/{doc_id}/versions", headers=api_headers)
         assert response.status_code == 200
         assert isinstance(response.json(), list)
 
 
+@pytest.mark.anyio
+@pytest.mark.integration
+@pytest.mark.usefixtures("api_db")
 class TestDocumentSearch:
     """Tests for document search."""
 
-    def test_search_documents(self, client, api_headers):
+    async def test_search_documents(self, client, json_headers):
         """Test searching documents."""
-        search_data = {"query": "foundation structural", "limit": 10}
-        response = client.post(
+        response = await client.post(
             "/api/v1/documents/search",
-            json=search_data,
-            headers=api_headers
+            content=SEARCH_BODY,
+            headers=json_headers
         )
         assert response.status_code == 200
         assert isinstance(response.json(), list)
 
 
+@pytest.mark.anyio
+@pytest.mark.integration
+@pytest.mark.usefixtures("api_db")
 class TestDocumentCrossReference:
     """Tests for document cross-reference queries."""
 
-    def test_get_documents_for_part(self, client, api_headers):
-        """Test getting documents linked to a part."""
-        part_id = str(uuid4())
-        response = client.get(
-            f"/api/v1/documents/by-part/{part_id}",
-            headers=api_headers
-        )
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-
-    def test_get_documents_for_bom(self, client, api_headers):
-        """Test getting documents linked to a BOM."""
-        bom_id = str(uuid4())
-        response = client.get(
-            f"/api/v1/documents/by-bom/{bom_id}",
-            headers=api_headers
-        )
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-
-    def test_get_documents_for_eco(self, client, api_headers):
-        """Test getting documents linked to an ECO."""
-        eco_id = str(uuid4())
-        response = client.get(
-            f"/api/v1/documents/by-eco/{eco_id}",
+    @pytest.mark.parametrize("kind", ["part", "bom", "eco"])
+    async def test_get_documents_for(self, client, api_headers, kind):
+        """Test getting documents linked to an unknown part, BOM or ECO."""
+        response = await client.get(
+            f"/api/v1/documents/by-{kind}/{next_id(kind)}",
             headers=api_headers
         )
         assert response.status_code == 200
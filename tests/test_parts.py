@@ -6,12 +6,16 @@ Tests Part model, dataclass, and database operations.
 
 import pytest
 from decimal import Decimal
-from uuid import uuid4
+
+from sqlalchemy import select
 
 from plm.parts.models import Part, PartType, PartStatus, UnitOfMeasure
 from plm.db.models import PartModel
 
+from tests._ids import next_id
+
 
+@pytest.mark.unit
 class TestPartModel:
     """Tests for Part dataclass model."""
 
@@ -31,23 +35,26 @@ class TestPartModel:
         assert data["status"] == "released"
         assert data["unit_cost"] == 8.99  # float, not string
 
-    def test_part_enums(self):
-        """Test part type and status enums."""
-        assert PartType.RAW_MATERIAL.value == "raw_material"
-        assert PartType.COMPONENT.value == "component"
-        assert PartType.ASSEMBLY.value == "assembly"
-        assert PartType.PRODUCT.value == "product"
-
-        assert PartStatus.DRAFT.value == "draft"
-        assert PartStatus.RELEASED.value == "released"
-        assert PartStatus.OBSOLETE.value == "obsolete"
-
-    def test_unit_of_measure_enums(self):
-        """Test unit of measure enums."""
-        assert UnitOfMeasure.EACH.value == "EA"
-        assert UnitOfMeasure.LINEAR_FEET.value == "LF"
-        assert UnitOfMeasure.SQUARE_FEET.value == "SF"
-        assert UnitOfMeasure.BOARD_FEET.value == "BF"
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (PartType.RAW_MATERIAL, "raw_material"),
+            (PartType.COMPONENT, "component"),
+            (PartType.ASSEMBLY, "assembly"),
+            (PartType.PRODUCT, "product"),
+            (PartStatus.DRAFT, "draft"),
+            (PartStatus.RELEASED, "released"),
+            (PartStatus.OBSOLETE, "obsolete"),
+            (UnitOfMeasure.EACH, "EA"),
+            (UnitOfMeasure.LINEAR_FEET, "LF"),
+            (UnitOfMeasure.SQUARE_FEET, "SF"),
+            (UnitOfMeasure.BOARD_FEET, "BF"),
+        ],
+    )
+    def test_enum_values(self, member, value):
+        """Test part type, status and unit of measure enums."""
+        assert member.value == value
+        assert type(member)(value) is member
 
 
 class TestPartDatabase:
@@ -55,7 +62,7 @@ class TestPartDatabase:
 
     def test_persist_part(self, session, sample_part_model):
         """Test persisting a part to database."""
-        found = session.query(PartModel).filter_by(id=sample_part_model.id).first()
+        found = session.scalars(select(PartModel).filter_by(id=sample_part_model.id)).first()
         assert found is not None
         assert found.part_number == "LUMBER-2X4-8FT"
         assert found.status == PartStatus.RELEASED
@@ -63,9 +70,9 @@ class TestPartDatabase:
     def test_query_parts_by_status(self, session, multiple_parts):
         """Test querying parts by status."""
         released = (
-            session.query(PartModel).filter_by(status=PartStatus.RELEASED).all()
+            session.scalars(select(PartModel).filter_by(status=PartStatus.RELEASED)).all()
         )
-        draft = session.query(PartModel).filter_by(status=PartStatus.DRAFT).all()
+        draft = session.scalars(select(PartModel).filter_by(status=PartStatus.DRAFT)).all()
 
         assert len(released) == 2
         assert len(draft) == 1
@@ -73,10 +80,10 @@ class TestPartDatabase:
     def test_query_parts_by_type(self, session, multiple_parts):
         """Test querying parts by type."""
         raw_materials = (
-            session.query(PartModel).filter_by(part_type=PartType.RAW_MATERIAL).all()
+            session.scalars(select(PartModel).filter_by(part_type=PartType.RAW_MATERIAL)).all()
         )
         assemblies = (
-            session.query(PartModel).filter_by(part_type=PartType.ASSEMBLY).all()
+            session.scalars(select(PartModel).filter_by(part_type=PartType.ASSEMBLY)).all()
         )
 
         assert len(raw_materials) == 2
@@ -88,7 +95,7 @@ class TestPartDatabase:
         sample_part_model.obsoleted_by = "test_user"
         session.commit()
 
-        found = session.query(PartModel).filter_by(id=sample_part_model.id).first()
+        found = session.scalars(select(PartModel).filter_by(id=sample_part_model.id)).first()
         assert found.status == PartStatus.OBSOLETE
         assert found.obsoleted_by == "test_user"
 
@@ -98,13 +105,13 @@ class TestPartDatabase:
         session.delete(sample_part_model)
         session.commit()
 
-        found = session.query(PartModel).filter_by(id=part_id).first()
+        found = session.scalars(select(PartModel).filter_by(id=part_id)).first()
         assert found is None
 
     def test_part_with_attributes(self, session):
         """Test part with JSON attributes."""
         part = PartModel(
-            id=str(uuid4()),
+            id=next_id(),
             part_number="SPECIAL-001",
             revision="A",
             name="Special Part",
@@ -117,7 +124,7 @@ class TestPartDatabase:
         session.add(part)
         session.commit()
 
-        found = session.query(PartModel).filter_by(part_number="SPECIAL-001").first()
+        found = session.scalars(select(PartModel).filter_by(part_number="SPECIAL-001")).first()
         assert found.attributes["color"] == "blue"
         assert "special" in found.tags
 
@@ -129,7 +136,7 @@ class TestPartRevision:
         """Test creating a new part revision."""
         # Create revision B
         new_revision = PartModel(
-            id=str(uuid4()),
+            id=next_id(),
             part_number=sample_part_model.part_number,
             revision="B",
             name=sample_part_model.name + " (Updated)",
@@ -143,10 +150,11 @@ class TestPartRevision:
 
         # Query all revisions
         revisions = (
-            session.query(PartModel)
-            .filter_by(part_number="LUMBER-2X4-8FT")
-            .order_by(PartModel.revision)
-            .all()
+            session.scalars(
+                select(PartModel)
+                .filter_by(part_number="LUMBER-2X4-8FT")
+                .order_by(PartModel.revision)
+            ).all()
         )
 
         assert len(revisions) == 2
@@ -7,7 +7,6 @@ Tests Project, Milestone, Deliverable, and related models.
 import pytest
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from uuid import uuid4
 
 from plm.projects.models import (
     Project,
@@ -20,6 +19,11 @@ from plm.projects.models import (
     DeliverableType,
 )
 
+from tests._ids import next_id
+
+
+pytestmark = pytest.mark.unit
+
 
 class TestProjectModel:
     """Tests for Project dataclass model."""
@@ -27,7 +31,7 @@ class TestProjectModel:
     def test_create_project(self):
         """Test creating a project."""
         project = Project(
-            id=str(uuid4()),
+            id=next_id(),
             project_number="PRJ-2024-001",
             name="New Widget Development",
             status=ProjectStatus.ACTIVE,
@@ -42,7 +46,7 @@ class TestProjectModel:
     def test_project_is_on_schedule_no_target(self):
         """Test is_on_schedule when no target date."""
         project = Project(
-            id=str(uuid4()),
+            id=next_id(),
             project_number="PRJ-001",
             name="Test Project",
         )
@@ -52,7 +56,7 @@ class TestProjectModel:
         """Test is_on_schedule for active project."""
         future_date = date.today() + timedelta(days=30)
         project = Project(
-            id=str(uuid4()),
+            id=next_id(),
             project_number="PRJ-001",
             name="Test Project",
             status=ProjectStatus.ACTIVE,
@@ -64,7 +68,7 @@ class TestProjectModel:
         """Test is_on_schedule when behind."""
         past_date = date.today() - timedelta(days=30)
         project = Project(
-            id=str(uuid4()),
+            id=next_id(),
             project_number="PRJ-001",
             name="Test Project",
             status=ProjectStatus.ACTIVE,
@@ -75,7 +79,7 @@ class TestProjectModel:
     def test_project_budget_variance(self):
         """Test budget variance calculation."""
         project = Project(
-            id=str(uuid4()),
+            id=next_id(),
             project_number="PRJ-001",
             name="Test Project",
             budget=Decimal("100000.00"),
@@ -128,7 +132,7 @@ class TestMilestoneModel:
     def test_create_milestone(self):
         """Test creating a milestone."""
         milestone = Milestone(
-            id=str(uuid4()),
+            id=next_id(),
             project_id="prj-001",
             milestone_number="M1",
             name="Preliminary Design Review",
@@ -143,7 +147,7 @@ class TestMilestoneModel:
         """Test days_until_due calculation."""
         future_date = date.today() + timedelta(days=15)
         milestone = Milestone(
-            id=str(uuid4()),
+            id=next_id(),
             project_id="prj-001",
             milestone_number="M1",
             name="PDR",
@@ -154,7 +158,7 @@ class TestMilestoneModel:
     def test_milestone_days_until_due_none(self):
         """Test days_until_due when no planned date."""
         milestone = Milestone(
-            id=str(uuid4()),
+            id=next_id(),
             project_id="prj-001",
             milestone_number="M1",
             name="PDR",
@@ -193,7 +197,7 @@ class TestDeliverableModel:
     def test_create_deliverable(self):
         """Test creating a deliverable."""
         deliverable = Deliverable(
-            id=str(uuid4()),
+            id=next_id(),
             project_id="prj-001",
             milestone_id="ms-001",
             deliverable_number="D1.1",
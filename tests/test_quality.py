@@ -0,0 +1,136 @@
+"""
+Tests for Quality Management Module
+
+Tests the quality service and model serialization.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import orjson
+import pytest
+
+from qms.quality import (
+    CAPAType,
+    NCRSeverity,
+    NCRSource,
+    QualityService,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _make_service() -> QualityService:
+    return QualityService()
+
+
+class TestQualityRelations:
+    """Tests for batched relation lookups on list endpoints."""
+
+    def test_list_ncrs_with_relations(self):
+        """Test NCRs are returned with their CAPA and active holds."""
+        service = _make_service()
+        ncr = service.create_ncr(
+            "Scratch", "Surface scratch", NCRSeverity.MAJOR, NCRSource.SUPPLIER, "user-1",
+            part_number="P-100", lot_number="L-1",
+        )
+        capa = service.create_capa(
+            "Fix", "Fix supplier process", CAPAType.CORRECTIVE, "user-1", "owner-1",
+            ncr_ids=[ncr.id],
+        )
+        service.link_capa(ncr.id, capa.id)
+
+        ncrs, prefetched = service.list_ncrs_with_relations()
+        data = ncrs[0].to_dict(prefetched=prefetched[ncr.id])
+
+        assert data["capa_number"] == capa.capa_number
+        assert len(data["active_holds"]) == 1
+
+    def test_list_capas_with_relations(self):
+        """Test CAPAs are returned with their linked NCR numbers."""
+        service = _make_service()
+        ncr = service.create_ncr(
+            "Scratch", "Surface scratch", NCRSeverity.MINOR, NCRSource.IN_PROCESS, "user-1",
+        )
+        service.create_capa(
+            "Fix", "Fix process", CAPAType.CORRECTIVE, "user-1", "owner-1",
+            ncr_ids=[ncr.id, "missing"],
+        )
+
+        capas, prefetched = service.list_capas_with_relations()
+        data = capas[0].to_dict(prefetched=prefetched[capas[0].id])
+
+        assert data["ncr_numbers"] == [ncr.ncr_number]
+        assert data["ncr_count"] == 2
+        assert "ncr_numbers" not in capas[0].to_dict()
+
+
+class TestQualityStatistics:
+    """Tests for cached quality statistics."""
+
+    def test_statistics_cached(self):
+        """Test repeated reads return the cached statistics."""
+        service = _make_service()
+        first = service.get_statistics()
+        assert service.get_statistics() is first
+
+    def test_statistics_invalidated_on_write(self):
+        """Test writes through the service refresh statistics."""
+        service = _make_service()
+        assert service.get_statistics()["inspections"]["total"] == 0
+
+        service.create_inspection(
+            "receiving", "user-1", "Inspector", quantity_inspected=Decimal("5"),
+        )
+        assert service.get_statistics()["inspections"]["total"] == 1
+
+    def test_quality_metrics_counts(self):
+        """Test open, critical and overdue counts."""
+        service = _make_service()
+        service.create_ncr("A", "a", NCRSeverity.CRITICAL, NCRSource.FIELD_FAILURE, "user-1")
+        service.create_ncr("B", "b", NCRSeverity.MINOR, NCRSource.FIELD_FAILURE, "user-1")
+        service.create_capa(
+            "Late", "late", CAPAType.CORRECTIVE, "user-1", "owner-1",
+            due_date=date.today() - timedelta(days=1),
+        )
+
+        metrics = service.get_quality_metrics()
+        assert metrics["ncrs"] == {
+            "total": 2, "open": 2, "critical": 1, "pending_disposition": 0,
+        }
+        assert metrics["capas"] == {"total": 1, "open": 1, "overdue": 1}
+
+
+class TestQualityJSONCache:
+    """Tests for the per-version JSON cache."""
+
+    def test_to_json_cached_until_write(self):
+        """Test encoded records are reused until the service changes them."""
+        service = _make_service()
+        ncr = service.create_ncr("A", "a", NCRSeverity.MINOR, NCRSource.FIELD_FAILURE, "user-1")
+        capa = service.create_capa("C", "c", CAPAType.CORRECTIVE, "user-1", "owner-1")
+
+        first = service.to_json(capa)
+        assert service.to_json(capa) is first
+        assert orjson.loads(first)["ncr_count"] == 0
+
+        service.link_capa(ncr.id, capa.id)
+        assert orjson.loads(service.to_json(capa))["ncr_count"] == 1
+        assert orjson.loads(service.to_json(ncr))["capa_id"] == capa.id
+
+
+class TestQualityListFilters:
+    """Tests for list method filtering."""
+
+    def test_list_holds_filters_and_limit(self):
+        """Test combined filters, active_only and limit on holds."""
+        service = _make_service()
+        for lot in ("L-1", "L-1", "L-2"):
+            service.create_hold("Suspect", "pending_inspection", "user-1", lot_number=lot)
+        released = service.list_holds(lot_number="L-1")[0]
+        service.release_hold(released.id, "user-2")
+
+        assert len(service.list_holds(lot_number="L-1")) == 2
+        assert len(service.list_holds(active_only=True, lot_number="L-1")) == 1
+        assert len(service.list_holds(hold_type="pending_inspection", limit=2)) == 2
+        assert service.list_holds(hold_type="ncr") == []
@@ -0,0 +1,96 @@
+"""
+QMS Quality Router Tests
+
+Tests the CAPA lifecycle endpoints through an in-process ASGI client.
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from qms.quality import CAPAStatus, CAPAType, QualityService, get_quality_service
+
+
+@pytest.fixture
+def quality_service() -> QualityService:
+    """Fresh in-memory quality service, isolated from the app's singleton."""
+    return QualityService()
+
+
+@pytest.fixture
+async def qms_client(quality_service):
+    """Client for the QMS app with its quality service overridden."""
+    from qms.api.app import app
+
+    app.dependency_overrides[get_quality_service] = lambda: quality_service
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            yield client
+    finally:
+        app.dependency_overrides.pop(get_quality_service, None)
+
+
+@pytest.fixture
+def verified_capa_id(quality_service) -> str:
+    """ID of a CAPA that has passed verification and awaits its effectiveness review."""
+    capa = quality_service.create_capa(
+        "Fix", "Fix process", CAPAType.CORRECTIVE, "user-1", "owner-1",
+    )
+    quality_service.verify_capa(capa.id, "qa-1", "audit", "actions in place")
+    return capa.id
+
+
+@pytest.mark.anyio
+@pytest.mark.integration
+class TestCAPARoutes:
+    """Tests for CAPA effectiveness review and closure."""
+
+    async def test_review_effectiveness(self, qms_client, quality_service, verified_capa_id, api_headers):
+        """Test an effective review is recorded and leaves the CAPA ready to close."""
+        response = await qms_client.post(
+            f"/api/v1/quality/capas/{verified_capa_id}/effectiveness",
+            json={"effective": True, "result": "No recurrence in 90 days"},
+            headers=api_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["status"] == CAPAStatus.EFFECTIVENESS_REVIEW.value
+
+        capa = quality_service.get_capa(verified_capa_id)
+        assert capa.effectiveness_result == "No recurrence in 90 days"
+        assert capa.effectiveness_review_date is not None
+
+    async def test_review_ineffective_reopens_implementation(
+        self, qms_client, verified_capa_id, api_headers
+    ):
+        """Test an ineffective review sends the CAPA back to implementation."""
+        response = await qms_client.post(
+            f"/api/v1/quality/capas/{verified_capa_id}/effectiveness",
+            json={"effective": False, "result": "Defect recurred"},
+            headers=api_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["status"] == CAPAStatus.IMPLEMENTATION.value
+
+    async def test_close_capa(self, qms_client, quality_service, verified_capa_id, api_headers):
+        """Test closing a CAPA records who closed it."""
+        response = await qms_client.post(
+            f"/api/v1/quality/capas/{verified_capa_id}/close",
+            json={"closed_by": "qa-manager"},
+            headers=api_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["status"] == CAPAStatus.CLOSED.value
+
+        capa = quality_service.get_capa(verified_capa_id)
+        assert capa.closed_by == "qa-manager"
+        assert capa.closed_date is not None
+
+    async def test_close_missing_capa(self, qms_client, api_headers):
+        """Test closing an unknown CAPA returns 404."""
+        response = await qms_client.post(
+            "/api/v1/quality/capas/missing/close",
+            json={"closed_by": "qa-manager"},
+            headers=api_headers,
+        )
+        assert response.status_code == 404
@@ -4,15 +4,9 @@ Repository Layer Tests
 Tests for the generic repository pattern and domain repositories.
 """
 
-import pytest
-from uuid import uuid4
 from decimal import Decimal
 from datetime import date, datetime
 
-from sqlalchemy import create_engine, StaticPool
-from sqlalchemy.orm import sessionmaker
-
-from plm.db.base import Base
 from plm.db.repository import BaseRepository
 from plm.db.models import (
     PartModel,
@@ -37,28 +31,7 @@ from plm.costing.repository import PartCostRepository, CostElementRepository
 from plm.service_bulletins.repository import ServiceBulletinRepository, BulletinComplianceRepository
 from plm.projects.repository import ProjectRepository, MilestoneRepository, DeliverableRepository
 
-
-# Test database setup
-test_engine = create_engine(
-    "sqlite:///:memory:",
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
-TestSessionLocal = sessionmaker(bind=test_engine, autocommit=False, autoflush=False)
-
-# Create all tables
-Base.metadata.create_all(bind=test_engine)
-
-
-@pytest.fixture
-def session():
-    """Create a fresh session for each test."""
-    db = TestSessionLocal()
-    try:
-        yield db
-    finally:
-        db.rollback()
-        db.close()
+from tests._ids import next_id
 
 
 # =============================================================================
@@ -101,7 +74,7 @@ class TestBaseRepository:
     def test_get_nonexistent_entity(self, session):
         """Test getting a nonexistent entity returns None."""
         repo = BaseRepository(session, PartModel)
-        result = repo.get(str(uuid4()))
+        result = repo.get(next_id())
         assert result is None
 
     def test_get_by_filters(self, session):
@@ -232,7 +205,7 @@ class TestRequirementRepository:
             status="draft",
             priority="must_have",
             title="Test Requirement",
-            project_id=str(uuid4()),
+            project_id=next_id(),
         )
         assert req.requirement_number == "REQ-TEST-001"
 
@@ -245,7 +218,7 @@ class TestRequirementRepository:
             status="draft",
             priority="should_have",
             title="Find Test",
-            project_id=str(uuid4()),
+            project_id=next_id(),
         )
         session.flush()
 
@@ -256,7 +229,7 @@ class TestRequirementRepository:
     def test_list_by_project(self, session):
         """Test listing requirements by project."""
         repo = RequirementRepository(session)
-        project_id = str(uuid4())
+        project_id = next_id()
 
         for i in range(3):
             repo.create(
@@ -399,7 +372,7 @@ class TestPartCostRepository:
         """Test creating a part cost."""
         repo = PartCostRepository(session)
         cost = repo.create(
-            part_id=str(uuid4()),
+            part_id=next_id(),
             part_number="PART-COST-001",
             currency="USD",
             material_cost=Decimal("100.00"),
@@ -414,7 +387,7 @@ class TestPartCostRepository:
         """Test getting cost for a part."""
         from plm.costing.models import CostEstimateStatus
         repo = PartCostRepository(session)
-        part_id = str(uuid4())
+        part_id = next_id()
         repo.create(
             part_id=part_id,
             part_number="PART-COST-002",
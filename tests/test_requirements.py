@@ -6,7 +6,6 @@ Tests Requirement, RequirementLink, and VerificationRecord models.
 
 import pytest
 from datetime import datetime
-from uuid import uuid4
 
 from plm.requirements.models import (
     Requirement,
@@ -20,6 +19,11 @@ from plm.requirements.models import (
     VerificationStatus,
 )
 
+from tests._ids import next_id
+
+
+pytestmark = pytest.mark.unit
+
 
 class TestRequirementModel:
     """Tests for Requirement dataclass model."""
@@ -27,7 +31,7 @@ class TestRequirementModel:
     def test_create_requirement(self):
         """Test creating a requirement."""
         req = Requirement(
-            id=str(uuid4()),
+            id=next_id(),
             requirement_number="REQ-001",
             requirement_type=RequirementType.CUSTOMER,
             title="Load Capacity",
@@ -88,7 +92,7 @@ class TestRequirementLink:
     def test_create_requirement_link(self):
         """Test creating a requirement link."""
         link = RequirementLink(
-            id=str(uuid4()),
+            id=next_id(),
             requirement_id="req-001",
             link_type="part",
             target_id="part-001",
@@ -123,7 +127,7 @@ class TestVerificationRecord:
     def test_create_verification_record(self):
         """Test creating a verification record."""
         record = VerificationRecord(
-            id=str(uuid4()),
+            id=next_id(),
             verification_number="VER-001",
             requirement_id="req-001",
             requirement_number="REQ-001",
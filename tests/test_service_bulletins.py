@@ -6,7 +6,6 @@ Tests ServiceBulletin, BulletinCompliance, and related models.
 
 import pytest
 from datetime import date, datetime
-from uuid import uuid4
 
 from plm.service_bulletins.models import (
     ServiceBulletin,
@@ -18,6 +17,11 @@ from plm.service_bulletins.models import (
     ComplianceStatus,
 )
 
+from tests._ids import next_id
+
+
+pytestmark = pytest.mark.unit
+
 
 class TestServiceBulletinModel:
     """Tests for ServiceBulletin dataclass model."""
@@ -25,7 +29,7 @@ class TestServiceBulletinModel:
     def test_create_service_bulletin(self):
         """Test creating a service bulletin."""
         sb = ServiceBulletin(
-            id=str(uuid4()),
+            id=next_id(),
             bulletin_number="SB-2024-001",
             bulletin_type=BulletinType.MANDATORY,
             title="Replace Widget Assembly",
@@ -80,7 +84,7 @@ class TestBulletinCompliance:
     def test_create_bulletin_compliance(self):
         """Test creating a bulletin compliance record."""
         compliance = BulletinCompliance(
-            id=str(uuid4()),
+            id=next_id(),
             bulletin_id="sb-001",
             bulletin_number="SB-2024-001",
             serial_number="SN-12345",
@@ -94,7 +98,7 @@ class TestBulletinCompliance:
     def test_bulletin_compliance_waived(self):
         """Test bulletin compliance with waiver."""
         compliance = BulletinCompliance(
-            id=str(uuid4()),
+            id=next_id(),
             bulletin_id="sb-001",
             bulletin_number="SB-2024-001",
             serial_number="SN-12345",
@@ -136,7 +140,7 @@ class TestMaintenanceSchedule:
     def test_create_maintenance_schedule(self):
         """Test creating a maintenance schedule."""
         schedule = MaintenanceSchedule(
-            id=str(uuid4()),
+            id=next_id(),
             schedule_code="100HR",
             part_number="ENGINE-001",
             system="Engine",
@@ -172,7 +176,7 @@ class TestUnitConfiguration:
     def test_create_unit_configuration(self):
         """Test creating a unit configuration."""
         config = UnitConfiguration(
-            id=str(uuid4()),
+            id=next_id(),
             serial_number="SN-12345",
             part_id="part-001",
             part_number="PRODUCT-001",
@@ -188,7 +192,7 @@ class TestUnitConfiguration:
     def test_unit_configuration_with_bulletins(self):
         """Test unit configuration with bulletin tracking."""
         config = UnitConfiguration(
-            id=str(uuid4()),
+            id=next_id(),
             serial_number="SN-12345",
             part_id="part-001",
             part_number="PRODUCT-001",
@@ -4,43 +4,16 @@ Service Layer Tests
 Tests for domain service classes.
 """
 
-import pytest
-from uuid import uuid4
 from decimal import Decimal
 from datetime import date
 
-from sqlalchemy import create_engine, StaticPool
-from sqlalchemy.orm import sessionmaker
-
-from plm.db.base import Base
 from plm.suppliers.service import ManufacturerService, VendorService, SupplierService
 from plm.compliance.service import ComplianceService
 from plm.costing.service import CostingService
 from plm.service_bulletins.service import ServiceBulletinService, MaintenanceService, UnitConfigurationService
 from plm.projects.service import ProjectService
 
-
-# Test database setup
-test_engine = create_engine(
-    "sqlite:///:memory:",
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
-TestSessionLocal = sessionmaker(bind=test_engine, autocommit=False, autoflush=False)
-
-# Create all tables
-Base.metadata.create_all(bind=test_engine)
-
-
-@pytest.fixture
-def session():
-    """Create a fresh session for each test."""
-    db = TestSessionLocal()
-    try:
-        yield db
-    finally:
-        db.rollback()
-        db.close()
+from tests._ids import next_id
 
 
 # =============================================================================
@@ -199,7 +172,7 @@ class TestComplianceService:
     def test_declare_substance(self, session):
         """Test declaring a substance in a part."""
         service = ComplianceService(session)
-        part_id = str(uuid4())
+        part_id = next_id()
 
         substance = service.declare_substance(
             part_id=part_id,
@@ -214,7 +187,7 @@ class TestComplianceService:
     def test_declare_substance_above_threshold(self, session):
         """Test substance above threshold."""
         service = ComplianceService(session)
-        part_id = str(uuid4())
+        part_id = next_id()
 
         substance = service.declare_substance(
             part_id=part_id,
@@ -227,7 +200,7 @@ class TestComplianceService:
     def test_get_part_substances(self, session):
         """Test getting substances for a part."""
         service = ComplianceService(session)
-        part_id = str(uuid4())
+        part_id = next_id()
 
         service.declare_substance(
             part_id=part_id,
@@ -256,7 +229,7 @@ class TestCostingService:
     def test_create_part_cost(self, session):
         """Test creating a part cost record."""
         service = CostingService(session)
-        part_id = str(uuid4())
+        part_id = next_id()
 
         cost = service.create_part_cost(
             part_id=part_id,
@@ -269,7 +242,7 @@ class TestCostingService:
     def test_add_cost_element(self, session):
         """Test adding a cost element."""
         service = CostingService(session)
-        part_id = str(uuid4())
+        part_id = next_id()
 
         cost = service.create_part_cost(part_id=part_id, part_number="PART-ELM-001")
         session.flush()
@@ -286,7 +259,7 @@ class TestCostingService:
     def test_get_cost_breakdown(self, session):
         """Test getting cost breakdown."""
         service = CostingService(session)
-        part_id = str(uuid4())
+        part_id = next_id()
 
         cost = service.create_part_cost(part_id=part_id, part_number="PART-BRK-001")
         session.flush()
@@ -314,7 +287,7 @@ class TestCostingService:
     def test_record_variance(self, session):
         """Test recording a cost variance."""
         service = CostingService(session)
-        part_id = str(uuid4())
+        part_id = next_id()
 
         variance = service.record_variance(
             part_id=part_id,
@@ -427,7 +400,7 @@ class TestUnitConfigurationService:
         service = UnitConfigurationService(session)
         unit = service.create_unit(
             serial_number="SN-001",
-            part_id=str(uuid4()),
+            part_id=next_id(),
             part_number="PART-001",
             owner_name="Test Owner",
         )
@@ -438,7 +411,7 @@ class TestUnitConfigurationService:
         service = UnitConfigurationService(session)
         service.create_unit(
             serial_number="SN-002",
-            part_id=str(uuid4()),
+            part_id=next_id(),
             part_number="PART-002",
         )
         session.flush()
@@ -451,7 +424,7 @@ class TestUnitConfigurationService:
         service = UnitConfigurationService(session)
         unit = service.create_unit(
             serial_number="SN-003",
-            part_id=str(uuid4()),
+            part_id=next_id(),
             part_number="PART-003",
         )
         session.flush()
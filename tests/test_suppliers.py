@@ -7,7 +7,6 @@ Tests Manufacturer, Vendor, ApprovedManufacturer, and ApprovedVendor models.
 import pytest
 from datetime import date, datetime
 from decimal import Decimal
-from uuid import uuid4
 
 from plm.suppliers.models import (
     Manufacturer,
@@ -20,6 +19,11 @@ from plm.suppliers.models import (
     QualificationStatus,
 )
 
+from tests._ids import next_id
+
+
+pytestmark = pytest.mark.unit
+
 
 class TestManufacturerModel:
     """Tests for Manufacturer dataclass model."""
@@ -27,7 +31,7 @@ class TestManufacturerModel:
     def test_create_manufacturer(self):
         """Test creating a manufacturer."""
         mfr = Manufacturer(
-            id=str(uuid4()),
+            id=next_id(),
             manufacturer_code="MFR-001",
             name="Acme Industries",
             country="USA",
@@ -72,7 +76,7 @@ class TestVendorModel:
     def test_create_vendor(self):
         """Test creating a vendor."""
         vendor = Vendor(
-            id=str(uuid4()),
+            id=next_id(),
             vendor_code="VND-001",
             name="ABC Distribution",
             country="USA",
@@ -118,7 +122,7 @@ class TestApprovedManufacturer:
     def test_create_approved_manufacturer(self):
         """Test creating an AML entry."""
         aml = ApprovedManufacturer(
-            id=str(uuid4()),
+            id=next_id(),
             part_id="part-001",
             part_number="PART-12345",
             manufacturer_id="mfr-001",
@@ -167,7 +171,7 @@ class TestApprovedVendor:
     def test_create_approved_vendor(self):
         """Test creating an AVL entry."""
         avl = ApprovedVendor(
-            id=str(uuid4()),
+            id=next_id(),
             part_id="part-001",
             part_number="PART-12345",
             vendor_id="vnd-001",
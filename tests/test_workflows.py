@@ -0,0 +1,265 @@
+"""
+Tests for Workflow Module
+
+Tests workflow definitions, instances, and the approval engine.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from plm.workflows import (
+    ApprovalDecision,
+    WorkflowDefinition,
+    WorkflowEngine,
+    WorkflowInstance,
+    WorkflowStage,
+    WorkflowStatus,
+    WorkflowTask,
+    WorkflowTransition,
+)
+from plm.workflows.models import RECENT_TRANSITIONS_LIMIT, create_eco_workflow
+
+pytestmark = pytest.mark.unit
+
+
+def _make_instance() -> WorkflowInstance:
+    return WorkflowInstance(
+        id="wfi-001",
+        definition_id="wf-eco-standard",
+        definition_name="Standard ECO Approval",
+        entity_type="eco",
+        entity_id="eco-001",
+        entity_number="ECO-001",
+    )
+
+
+class TestWorkflowDefinition:
+    """Tests for WorkflowDefinition stage routing."""
+
+    def test_stage_order(self):
+        """Test stages are ordered by sequence regardless of list order."""
+        definition = WorkflowDefinition(
+            id="wf-test",
+            name="Test Workflow",
+            stages=[
+                WorkflowStage(id="stage-b", name="B", sequence=20),
+                WorkflowStage(id="stage-a", name="A", sequence=10),
+                WorkflowStage(id="stage-c", name="C", sequence=30),
+            ],
+        )
+        assert definition.get_first_stage().id == "stage-a"
+        assert definition.get_next_stage("stage-a").id == "stage-b"
+        assert definition.get_next_stage("stage-b").id == "stage-c"
+        assert definition.get_next_stage("stage-c") is None
+        assert definition.get_next_stage("missing") is None
+
+    def test_empty_definition(self):
+        """Test a definition without stages."""
+        definition = WorkflowDefinition(id="wf-empty", name="Empty")
+        assert definition.get_first_stage() is None
+
+    def test_next_stage_on_decision(self):
+        """Test branching edges are followed for approve/reject decisions."""
+        definition = WorkflowDefinition(
+            id="wf-branch",
+            name="Branching Workflow",
+            stages=[
+                WorkflowStage(
+                    id="stage-review",
+                    name="Review",
+                    sequence=10,
+                    next_stage_on_approve="stage-release",
+                    next_stage_on_reject="stage-rework",
+                ),
+                WorkflowStage(id="stage-rework", name="Rework", sequence=20),
+                WorkflowStage(id="stage-release", name="Release", sequence=30),
+            ],
+        )
+        approve = definition.get_next_stage_on_decision("stage-review", ApprovalDecision.APPROVED)
+        reject = definition.get_next_stage_on_decision("stage-review", ApprovalDecision.REJECTED)
+        abstain = definition.get_next_stage_on_decision("stage-review", ApprovalDecision.ABSTAIN)
+
+        assert approve.id == "stage-release"
+        assert reject.id == "stage-rework"
+        assert abstain is None
+
+    def test_next_stage_on_decision_falls_back_to_sequence(self):
+        """Test approval without an explicit edge follows stage sequence."""
+        definition = create_eco_workflow()
+        next_stage = definition.get_next_stage_on_decision(
+            "stage-submit", ApprovalDecision.APPROVED_WITH_CONDITIONS
+        )
+        assert next_stage.id == "stage-engineering"
+        assert definition.get_next_stage_on_decision(
+            "stage-submit", ApprovalDecision.REJECTED
+        ) is None
+
+    def test_add_stage(self):
+        """Test stages added after construction are routable."""
+        definition = create_eco_workflow()
+        assert definition.get_stage("stage-closeout") is None
+
+        definition.add_stage(WorkflowStage(id="stage-closeout", name="Closeout", sequence=50))
+        assert definition.get_stage("stage-closeout").name == "Closeout"
+        assert definition.get_next_stage("stage-final").id == "stage-closeout"
+
+
+class TestWorkflowInstance:
+    """Tests for WorkflowInstance history."""
+
+    def test_recent_transitions(self):
+        """Test the recent window returns the latest transitions in order."""
+        instance = _make_instance()
+        for i in range(5):
+            instance.add_transition(WorkflowTransition(
+                id=f"tr-{i}", instance_id="", timestamp=datetime.now(),
+            ))
+
+        assert [t.id for t in instance.recent_transitions(2)] == ["tr-3", "tr-4"]
+        assert len(instance.recent_transitions(10)) == 5
+        assert instance.recent_transitions(0) == []
+        assert all(t.instance_id == instance.id for t in instance.transitions)
+
+    def test_to_dict_limits_transitions(self):
+        """Test to_dict only serializes the recent window of history."""
+        instance = _make_instance()
+        total = RECENT_TRANSITIONS_LIMIT + 10
+        for i in range(total):
+            instance.add_transition(WorkflowTransition(
+                id=f"tr-{i}", instance_id="", timestamp=datetime.now(),
+            ))
+
+        data = instance.to_dict()
+        assert len(data["transitions"]) == RECENT_TRANSITIONS_LIMIT
+        assert data["transitions"][-1]["id"] == f"tr-{total - 1}"
+        assert len(instance.to_dict(transitions_limit=5)["transitions"]) == 5
+        assert len(instance.to_dict(transitions_limit=None)["transitions"]) == total
+
+    def test_export_transitions(self):
+        """Test paging through the transition history."""
+        instance = _make_instance()
+        for i in range(5):
+            instance.add_transition(WorkflowTransition(
+                id=f"tr-{i}", instance_id="", timestamp=datetime.now(),
+            ))
+
+        assert [t["id"] for t in instance.export_transitions(1, 2)] == ["tr-1", "tr-2"]
+        assert [t["id"] for t in instance.export_transitions(3)] == ["tr-3", "tr-4"]
+        assert instance.export_transitions(10, 2) == []
+
+    def test_get_task(self):
+        """Test task lookup sees tasks added after the first lookup."""
+        instance = _make_instance()
+        assert instance.get_task("task-1") is None
+
+        instance.add_task(WorkflowTask(
+            id="task-1",
+            instance_id="",
+            stage_id="stage-submit",
+            stage_name="Submission Review",
+            assignee_id="user-1",
+            assignee_name="User One",
+        ))
+        task = instance.get_task("task-1")
+        assert task is not None
+        assert task.instance_id == instance.id
+
+    def test_to_dict_json_serializable(self):
+        """Test to_dict output round-trips through the stdlib json module."""
+        instance = _make_instance()
+        instance.add_transition(WorkflowTransition(
+            id="tr-0",
+            instance_id="",
+            timestamp=datetime(2026, 1, 1, 12, 0),
+            from_status=WorkflowStatus.DRAFT,
+            to_status=WorkflowStatus.ACTIVE,
+        ))
+
+        data = json.loads(json.dumps(instance.to_dict()))
+        assert data["status"] == "draft"
+        assert data["transitions"][0]["to_status"] == "active"
+        assert data["transitions"][0]["decision"] is None
+        assert data["transitions"][0]["timestamp"] == "2026-01-01T12:00:00"
+
+
+class TestWorkflowEngine:
+    """Tests for WorkflowEngine execution."""
+
+    def test_document_review_to_completion(self):
+        """Test approving every stage completes the workflow."""
+        engine = WorkflowEngine()
+        instance = engine.start_workflow(
+            definition_id="wf-doc-review",
+            entity_type="document",
+            entity_id="doc-001",
+            entity_number="DWG-001",
+            initiated_by="user-1",
+        )
+        assert instance.status == WorkflowStatus.PENDING_APPROVAL
+        assert instance.current_stage_id == "stage-peer-review"
+
+        for _ in range(2):
+            task = instance.current_stage_tasks[0]
+            engine.process_decision(instance.id, task.id, ApprovalDecision.APPROVED, "user-2")
+
+        assert instance.status == WorkflowStatus.COMPLETED
+        assert len(instance.pending_tasks) == instance.pending_count == 0
+        assert len(instance.completed_tasks) == instance.completed_count == 2
+
+    def test_task_counts_after_delegate_and_recall(self):
+        """Test task counts stay in step with delegation and recall."""
+        engine = WorkflowEngine()
+        instance = engine.start_workflow(
+            definition_id="wf-eco-standard",
+            entity_type="eco",
+            entity_id="eco-001",
+            entity_number="ECO-001",
+            initiated_by="user-1",
+        )
+        task = instance.current_stage_tasks[0]
+        engine.delegate_task(instance.id, task.id, "user-1", "user-3", "User Three")
+        assert instance.pending_count == 1
+        assert instance.completed_count == 1
+
+        engine.recall_workflow(instance.id, "user-1", reason="Superseded")
+        data = instance.to_dict()
+        assert data["pending_tasks"] == len(instance.pending_tasks) == 0
+        assert data["completed_tasks"] == len(instance.completed_tasks) == 2
+
+    def test_task_counts_after_direct_decision(self):
+        """Test task counts follow a decision assigned on the task itself."""
+        instance = _make_instance()
+        instance.add_task(WorkflowTask(
+            id="task-1",
+            instance_id="",
+            stage_id="stage-1",
+            stage_name="Review",
+            assignee_id="user-1",
+            assignee_name="User One",
+        ))
+        instance.tasks[0].decision = ApprovalDecision.APPROVED
+
+        assert instance.pending_count == 0
+        assert instance.completed_count == 1
+        assert instance.to_dict()["completed_tasks"] == 1
+
+    def test_rejection(self):
+        """Test a rejection ends the workflow."""
+        engine = WorkflowEngine()
+        instance = engine.start_workflow(
+            definition_id="wf-doc-review",
+            entity_type="document",
+            entity_id="doc-002",
+            entity_number="DWG-002",
+            initiated_by="user-1",
+        )
+        task = instance.current_stage_tasks[0]
+        engine.process_decision(
+            instance.id, task.id, ApprovalDecision.REJECTED, "user-2", comments="Incomplete"
+        )
+
+        assert instance.status == WorkflowStatus.REJECTED
+        assert instance.final_comments == "Incomplete"
+        assert instance.to_dict()["transitions"][-1]["trigger_type"] == "rejection"